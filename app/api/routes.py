@@ -11,6 +11,7 @@ from fastapi.responses import Response
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
+from app.config import SecurityConfig
 from app.database import get_db
 
 # Import custom exceptions
@@ -49,6 +50,7 @@ from app.services.two_factor_auth_service import (
     is_2fa_attempt_allowed,
     record_2fa_attempt,
 )
+from app.utils.downsample import DEFAULT_CHART_POINTS, lttb_downsample
 
 logger = logging.getLogger(__name__)
 
@@ -271,6 +273,7 @@ async def register_user(
 # User login endpoint
 @router.post("/users/login")
 async def login_user(
+    response: Response,
     form_data: OAuth2PasswordRequestForm = Depends(), 
     otp: str | None = None,  # Optional OTP for 2FA
     db: Session = Depends(get_db)
@@ -355,6 +358,17 @@ async def login_user(
         # Log successful login
         logger.info(f"User {user.username} (ID: {user.id}) logged in successfully")
 
+        # httpOnly session cookie: the browser sends it with the WebSocket upgrade,
+        # so the dashboard never keeps the token in script-readable storage
+        response.set_cookie(
+            SecurityConfig.SESSION_COOKIE_NAME,
+            access_token,
+            max_age=int(access_token_expires.total_seconds()),
+            httponly=True,
+            secure=SecurityConfig.SESSION_COOKIE_SECURE,
+            samesite="strict",
+        )
+
         return {
             "access_token": access_token,
             "refresh_token": refresh_token,
@@ -381,6 +395,19 @@ async def login_user(
         )
 
 
+# Browser session logout (clears the httpOnly session cookie)
+@router.delete("/users/session")
+async def clear_session(response: Response):
+    """Clear the dashboard session cookie"""
+    response.delete_cookie(
+        SecurityConfig.SESSION_COOKIE_NAME,
+        httponly=True,
+        secure=SecurityConfig.SESSION_COOKIE_SECURE,
+        samesite="strict",
+    )
+    return {"message": "Session cleared"}
+
+
 # Email verification endpoint
 @router.post("/users/verify-email")
 async def verify_email(verification_data: EmailVerificationRequest, db: Session = Depends(get_db)):
@@ -1558,6 +1585,9 @@ async def get_historical_data(
     symbol: str,
     period: int = Query(default=30, ge=1, le=365, description="Number of days"),
     interval: str = Query(default="daily", pattern="^(hourly|daily|weekly)$"),
+    points: int = Query(
+        default=DEFAULT_CHART_POINTS, ge=10, le=2000, description="Max points (chart width in px)"
+    ),
 ):
     """Get historical data for an asset"""
     try:
@@ -1576,11 +1606,16 @@ async def get_historical_data(
                 detail=f"No historical data found for symbol: {symbol}",
             )
 
+        chart_data = data.get("chart_data", [])
+        if chart_data:
+            value_key = "close" if "close" in chart_data[0] else "price"
+            chart_data = lttb_downsample(chart_data, points, value_key=value_key)
+
         return {
             "symbol": symbol.upper(),
             "period": period,
             "interval": interval,
-            "data": data.get("chart_data", []),
+            "data": chart_data,
             "current_price": data.get("current_price"),
             "timestamp": data.get("timestamp"),
         }
@@ -23,8 +23,8 @@ Functions:
 """
 
 import asyncio
-import json
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime
 
 from app.utils.yfinance_safe import get_yf
@@ -35,12 +35,16 @@ import uuid
 from fastapi import Query, WebSocket, WebSocketDisconnect
 from prometheus_client import Counter, Gauge
 
-from app.managers.connection_manager import ConnectionManager
+from app.config import SecurityConfig
+from app.managers.connection_manager import MAX_QUEUE_SIZE, ConnectionManager
 from app.managers.data_manager import DataManager
 from app.managers.subscription_manager import SubscriptionManager
 from app.services.auth_manager import AuthManager
 from app.services.delta_manager import DeltaManager
 from app.services.metrics_collector import MetricsCollector
+from app.services.monitoring_service import get_monitoring_service
+from app.services.redis_cache_service import get_redis_cache_service
+from app.utils.serialization import DecodeError, PreparedMessage, dumps, dumps_str, loads
 
 logger = logging.getLogger(__name__)
 
@@ -499,6 +503,21 @@ MAX_CLIENTS = 1000
 HEARTBEAT_INTERVAL = 30  # seconds
 CLIENT_TIMEOUT = 120  # seconds
 
+# Symbols streamed to clients without explicit subscriptions
+DEFAULT_SYMBOLS = ["AAPL", "GOOGL", "MSFT", "bitcoin", "ethereum", "GC=F"]
+
+# Server-Sent Events: comment line sent when a stream is idle so proxies keep it open
+SSE_KEEPALIVE = b": keepalive\n\n"
+
+# Multi-worker deployments (uvicorn --workers N): one leader worker fetches upstream
+# data and publishes every tick over Redis; the others fan it out to their own clients.
+# Without Redis each process runs alone and is always the leader.
+STREAM_LEADER_KEY = "finance_monitor:stream_leader"
+STREAM_LEADER_TTL = 60  # seconds; renewed every tick, a dead leader is replaced after it
+STREAM_CHANNEL = "finance_monitor:stream_ticks"
+# Followers advertise the symbols their clients want so the leader fetches them too
+STREAM_SYMBOLS_PREFIX = "finance_monitor:stream_symbols:"
+
 
 class WebSocketManager:
     """Manage WebSocket connections and data streaming"""
@@ -510,6 +529,12 @@ class WebSocketManager:
         self.subscription_manager = SubscriptionManager()
         self.connection_manager = ConnectionManager(self.metrics)
         self.delta_manager = DeltaManager()
+        # Server-Sent Events subscribers: queue -> requested symbols (empty = defaults)
+        self.event_streams: dict[asyncio.Queue, tuple[str, ...]] = {}
+        # Cross-worker data stream: leader lock token, or the follower's tick subscription
+        self.worker_id = uuid.uuid4().hex[:8]
+        self.stream_leader_token: str | None = None
+        self._tick_subscription = None
         # Shutdown event for graceful shutdown
         self.shutdown_event = asyncio.Event()
 
@@ -531,7 +556,7 @@ class WebSocketManager:
 
     async def _send_to_clients(self, clients, message):
         """Send message to specific clients"""
-        message_str = json.dumps(message)
+        message_str = dumps_str(message)
         disconnected_clients = set()
 
         for client in clients:
@@ -553,8 +578,7 @@ class WebSocketManager:
         """Send initial data to newly connected client"""
         try:
             # Get initial data for default instruments
-            default_symbols = ["AAPL", "GOOGL", "MSFT", "bitcoin", "ethereum", "GC=F"]
-            assets_data = await self.get_assets_data(default_symbols)
+            assets_data = await self.get_assets_data(DEFAULT_SYMBOLS)
 
             # Send initialization message
             init_message = {
@@ -562,7 +586,7 @@ class WebSocketManager:
                 "timestamp": datetime.now().isoformat(),
                 "data": assets_data,
             }
-            await websocket.send_text(json.dumps(init_message))
+            await websocket.send_text(dumps_str(init_message))
 
             # Send periodic updates
             update_message = {
@@ -570,17 +594,24 @@ class WebSocketManager:
                 "timestamp": datetime.now().isoformat(),
                 "data": assets_data,
             }
-            await websocket.send_text(json.dumps(update_message))
+            await websocket.send_text(dumps_str(update_message))
 
         except Exception as e:
             logger.error(f"Error sending initial data: {e}")
             error_message = {"type": "error", "message": "Error initializing connection"}
-            await websocket.send_text(json.dumps(error_message))
+            await websocket.send_text(dumps_str(error_message))
 
     async def handle_message(self, websocket: WebSocket, message: str):
         """Handle incoming WebSocket messages"""
         try:
-            data = json.loads(message)
+            data = loads(message)
+        except DecodeError as e:
+            logger.error(f"Error decoding JSON message: {e}")
+            error_message = {"type": "error", "message": "Invalid JSON format"}
+            await self.connection_manager.send_message(websocket, error_message)
+            return
+
+        try:
             action = data.get("action")
 
             if action == "refresh":
@@ -597,19 +628,19 @@ class WebSocketManager:
                 await self.handle_unsubscribe(websocket, data.get("symbols", []))
             elif action == "heartbeat":
                 await self.handle_heartbeat(websocket)
+            elif action == "pause":
+                await self.handle_pause(websocket)
+            elif action == "resume":
+                await self.handle_resume(websocket)
             else:
                 logger.warning(f"Unknown action received: {action}")
                 error_message = {"type": "error", "message": f"Unknown action: {action}"}
-                await websocket.send_text(json.dumps(error_message))
+                await self.connection_manager.send_message(websocket, error_message)
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Error decoding JSON message: {e}")
-            error_message = {"type": "error", "message": "Invalid JSON format"}
-            await websocket.send_text(json.dumps(error_message))
         except Exception as e:
             logger.error(f"Error handling WebSocket message: {e}")
             error_message = {"type": "error", "message": "Error processing request"}
-            await websocket.send_text(json.dumps(error_message))
+            await self.connection_manager.send_message(websocket, error_message)
 
     async def handle_refresh(self, websocket: WebSocket):
         """Handle refresh action"""
@@ -622,15 +653,16 @@ class WebSocketManager:
             # Refresh all data for client's subscriptions or default symbols
             symbols = list(self.subscription_manager.get_client_subscriptions(client_id))
             if not symbols:
-                symbols = ["AAPL", "GOOGL", "MSFT", "bitcoin", "ethereum", "GC=F"]
+                symbols = DEFAULT_SYMBOLS
 
             assets_data = await self.get_assets_data(symbols[:15])  # Limit for performance
+            # Full state: the client replaces what it has (stream ticks carry only changes)
             update_message = {
-                "type": "update",
+                "type": "snapshot",
                 "timestamp": datetime.now().isoformat(),
                 "data": assets_data,
             }
-            await self.connection_manager.send_message(websocket, update_message)
+            await self.connection_manager.send_snapshot(websocket, update_message)
         except Exception as e:
             logger.error(f"Error handling refresh: {e}")
 
@@ -645,6 +677,8 @@ class WebSocketManager:
 
                 # Add to subscription manager
                 self.subscription_manager.subscribe(client_id, [symbol.upper()])
+                # Stream ticks carry only changes: deliver the new symbol's data now
+                await self.handle_refresh(websocket)
 
                 # Send updated watchlist
                 watchlist_message = {
@@ -700,6 +734,8 @@ class WebSocketManager:
 
                 # Add symbols to subscription manager
                 self.subscription_manager.subscribe(client_id, [s.upper() for s in symbols])
+                # Stream ticks carry only changes: deliver the new symbols' data now
+                await self.handle_refresh(websocket)
 
                 notification_message = {
                     "type": "notification",
@@ -741,6 +777,78 @@ class WebSocketManager:
         except Exception as e:
             logger.error(f"Error handling heartbeat: {e}")
 
+    async def handle_pause(self, websocket: WebSocket):
+        """Handle pause action (dashboard tab hidden): stop streaming updates to the client"""
+        info = self.connection_manager.active_connections.get(websocket)
+        if info is not None:
+            info["paused"] = True
+
+    async def handle_resume(self, websocket: WebSocket):
+        """Handle resume action: restart streaming with a snapshot of the missed state"""
+        info = self.connection_manager.active_connections.get(websocket)
+        if info is not None and info.pop("paused", False):
+            await self.handle_refresh(websocket)
+
+    async def event_stream(self, symbols: list[str] | None = None) -> AsyncIterator[bytes]:
+        """
+        Read-only Server-Sent Events stream of asset updates
+
+        Receives the same update messages as WebSocket clients (serialized once per tick
+        and shared), without WebSocket framing or per-connection receive loops.
+
+        Args:
+            symbols: Symbols to stream (default symbols when empty)
+
+        Yields:
+            SSE-encoded frames (a snapshot first, then updates and keepalives)
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
+        self.event_streams[queue] = tuple(symbols or ())
+
+        async def snapshot_frame() -> bytes:
+            assets_data = await self.get_assets_data((symbols or DEFAULT_SYMBOLS)[:15])
+            snapshot = {
+                "type": "snapshot",
+                "timestamp": datetime.now().isoformat(),
+                "data": assets_data,
+            }
+            return b"data: " + dumps_str(snapshot).encode("utf-8") + b"\n\n"
+
+        try:
+            # retry: reconnect delay hint for EventSource, in milliseconds
+            yield b"retry: 5000\n\n"
+            yield await snapshot_frame()
+
+            while not self.shutdown_event.is_set():
+                try:
+                    text = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_INTERVAL)
+                except TimeoutError:
+                    yield SSE_KEEPALIVE
+                    continue
+                if text is None:
+                    # Updates were dropped: resend the full state (it covers the rest)
+                    while not queue.empty():
+                        queue.get_nowait()
+                    yield await snapshot_frame()
+                    continue
+                yield b"data: " + text.encode("utf-8") + b"\n\n"
+        finally:
+            self.event_streams.pop(queue, None)
+
+    def _publish_event(self, queue: asyncio.Queue, text: str) -> None:
+        """
+        Queue a serialized message for an SSE subscriber
+
+        Updates carry only changed assets, so when the queue is full its pending
+        updates are replaced by a resync marker (None) and the subscriber gets a
+        fresh snapshot instead.
+        """
+        if queue.full():
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+        queue.put_nowait(text)
+
     async def get_assets_data(self, symbols: list[str]) -> list[dict]:
         """Get data for multiple assets with semaphore for concurrency control"""
         return await self.data_manager.get_assets_data(symbols)
@@ -749,97 +857,224 @@ class WebSocketManager:
         """Get data for a single asset"""
         return await self.data_manager.get_asset_data(symbol)
 
+    async def fetch_assets(self, symbols: list[str]) -> list[dict]:
+        """Fetch asset data from upstream sources in concurrent batches"""
+        batch_size = 100  # Increased from 30 for better performance
+        all_assets_data = []
+
+        # Process batches concurrently for better performance
+        batch_tasks = []
+        for i in range(0, len(symbols), batch_size):
+            batch_symbols = symbols[i : i + batch_size]
+            task = self.get_assets_data(batch_symbols)
+            batch_tasks.append(task)
+
+        # Gather all batch results concurrently
+        batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
+
+        # Process results
+        for result in batch_results:
+            if isinstance(result, Exception):
+                logger.error(f"Error in batch processing: {result}")
+                continue
+            elif result is not None and not isinstance(result, BaseException):
+                all_assets_data.extend(result)
+        return all_assets_data
+
+    async def hold_stream_leadership(self) -> bool:
+        """
+        Acquire or renew the cross-worker data stream leadership
+
+        Returns:
+            True if this worker fetches upstream data
+        """
+        redis_cache = get_redis_cache_service()
+        if self.stream_leader_token is not None:
+            if await redis_cache.extend_lock(
+                STREAM_LEADER_KEY, self.stream_leader_token, STREAM_LEADER_TTL
+            ):
+                return True
+            logger.warning("Data stream leadership lost, switching to follower mode")
+            self.stream_leader_token = None
+
+        self.stream_leader_token = await redis_cache.acquire_lock(
+            STREAM_LEADER_KEY, ttl=STREAM_LEADER_TTL
+        )
+        if self.stream_leader_token is None:
+            return False
+        logger.info(f"Worker {self.worker_id} is the data stream leader")
+        await self._close_tick_subscription()
+        return True
+
+    async def next_tick(self, symbols: list[str]) -> list[dict] | None:
+        """
+        Get the asset data of the next tick
+
+        The leader fetches it upstream (including the symbols followers asked for) and
+        publishes it; followers receive the leader's tick instead of fetching.
+
+        Args:
+            symbols: Symbols wanted by this worker's clients
+
+        Returns:
+            Asset data, or None if a follower received nothing within the leader TTL
+        """
+        redis_cache = get_redis_cache_service()
+        if await self.hold_stream_leadership():
+            for value in await redis_cache.get_pattern_values(f"{STREAM_SYMBOLS_PREFIX}*"):
+                symbols = list(dict.fromkeys([*symbols, *value.decode("utf-8").split(",")]))
+            assets = await self.fetch_assets(symbols)
+            if assets:
+                await redis_cache.publish(STREAM_CHANNEL, dumps(assets))
+            return assets
+
+        await redis_cache.set(
+            f"{STREAM_SYMBOLS_PREFIX}{self.worker_id}",
+            ",".join(symbols).encode("utf-8"),
+            ttl=STREAM_LEADER_TTL,
+        )
+        if self._tick_subscription is None:
+            self._tick_subscription = await redis_cache.subscribe(STREAM_CHANNEL)
+            if self._tick_subscription is None:
+                return None
+        try:
+            message = await self._tick_subscription.get_message(
+                ignore_subscribe_messages=True, timeout=STREAM_LEADER_TTL
+            )
+        except Exception as e:
+            logger.warning(f"Tick subscription failed, resubscribing: {e}")
+            await self._close_tick_subscription()
+            return None
+        return loads(message["data"]) if message else None
+
+    async def _close_tick_subscription(self) -> None:
+        """Stop receiving the leader's ticks"""
+        if self._tick_subscription is not None:
+            try:
+                await self._tick_subscription.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing tick subscription: {e}")
+            self._tick_subscription = None
+
+    async def release_stream_leadership(self) -> None:
+        """Hand the leadership over on shutdown so another worker takes it immediately"""
+        await self._close_tick_subscription()
+        if self.stream_leader_token is not None:
+            await get_redis_cache_service().release_lock(
+                STREAM_LEADER_KEY, self.stream_leader_token
+            )
+            self.stream_leader_token = None
+
     async def data_stream_worker(self):
         """Background worker to stream data to subscribed clients only with performance optimizations"""
+        try:
+            await self._stream_loop()
+        finally:
+            await self.release_stream_leadership()
+
+    async def _stream_loop(self):
+        """Fetch (or receive) a tick, then broadcast changed assets to each client group"""
         while not self.shutdown_event.is_set():
             try:
                 # Get all subscribed symbols
                 unique_symbols = self.subscription_manager.get_all_subscribed_symbols()
-                if not unique_symbols:
-                    # If no subscriptions, send data for default symbols
-                    unique_symbols = ["AAPL", "GOOGL", "MSFT", "bitcoin", "ethereum", "GC=F"][:15]
+                # Paused clients (hidden dashboard tabs) are skipped until they resume
+                client_subscriptions = {
+                    websocket: self.subscription_manager.get_client_subscriptions(info["id"])
+                    for websocket, info in list(self.connection_manager.active_connections.items())
+                    if not info.get("paused")
+                }
+                # Clients that lost a queued delta get a full snapshot instead of this tick
+                resync = {
+                    websocket
+                    for websocket in client_subscriptions
+                    if self.connection_manager.active_connections.get(websocket, {}).get(
+                        "needs_snapshot"
+                    )
+                }
+                event_streams = list(self.event_streams.items())
+                for _, stream_symbols in event_streams:
+                    if stream_symbols:
+                        unique_symbols = list(dict.fromkeys([*unique_symbols, *stream_symbols]))
+                if (
+                    not unique_symbols
+                    or not all(client_subscriptions.values())
+                    or not all(stream_symbols for _, stream_symbols in event_streams)
+                ):
+                    # Clients without subscriptions receive the default symbols
+                    unique_symbols = list(dict.fromkeys([*unique_symbols, *DEFAULT_SYMBOLS]))
 
                 # Early exit if no symbols to process
                 if not unique_symbols:
                     await asyncio.sleep(15)  # Wait before next check
                     continue
 
-                # Get data for symbols with optimized batch sizes
-                batch_size = 100  # Increased from 30 for better performance
-                all_assets_data = []
-
-                # Process batches concurrently for better performance
-                batch_tasks = []
-                for i in range(0, len(unique_symbols), batch_size):
-                    batch_symbols = unique_symbols[i : i + batch_size]
-                    task = self.get_assets_data(batch_symbols)
-                    batch_tasks.append(task)
-
-                # Gather all batch results concurrently
-                batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-
-                # Process results
-                for result in batch_results:
-                    if isinstance(result, Exception):
-                        logger.error(f"Error in batch processing: {result}")
-                        continue
-                    elif result is not None and not isinstance(result, BaseException):
-                        all_assets_data.extend(result)
+                # Leader fetches upstream; followers block until the leader's tick arrives
+                all_assets_data = await self.next_tick(unique_symbols)
 
                 # Early exit if no data
                 if not all_assets_data:
                     await asyncio.sleep(5)  # Wait before next check
                     continue
 
-                # Send data to subscribed clients with improved efficiency
-                # Group symbols by client to reduce iterations
-                client_symbols = {}
-                for symbol in unique_symbols:
-                    client_ids = self.subscription_manager.get_symbol_subscribers(symbol)
-                    for client_id in client_ids:
-                        if client_id not in client_symbols:
-                            client_symbols[client_id] = []
-                        client_symbols[client_id].append(symbol)
-
-                # Send updates to clients concurrently
-                update_tasks = []
-                for client_id, symbols in client_symbols.items():
-                    # Get symbol data for this client
-                    client_data = [d for d in all_assets_data if d["symbol"] in symbols]
-                    if client_data:
-                        # Apply delta updates
-                        updated_data = []
-                        for data in client_data:
-                            delta = self.delta_manager.get_delta(data["symbol"], data)
-                            if delta:  # Only send if there are changes
-                                updated_data.append(data)
-
-                        if updated_data:
-                            message = {
+                # Compute deltas once per tick: delta state is per symbol, so checking it
+                # per client would hide the update from every client after the first one
+                changed_flags = self.delta_manager.changed_mask(all_assets_data)
+                changed = {
+                    data["symbol"].upper(): data
+                    for data, is_changed in zip(all_assets_data, changed_flags)
+                    if is_changed
+                }
+
+                # Group sockets by the symbols they receive so each distinct payload
+                # is serialized once and the same frame is written to every socket
+                groups: dict[tuple[str, ...], list[WebSocket]] = {}
+                default_symbols = {symbol.upper() for symbol in DEFAULT_SYMBOLS}
+                for websocket, subscriptions in client_subscriptions.items():
+                    if websocket in resync:
+                        continue
+                    wanted = subscriptions or default_symbols
+                    symbols = tuple(symbol for symbol in changed if symbol in wanted)
+                    if symbols:
+                        groups.setdefault(symbols, []).append(websocket)
+
+                timestamp = datetime.now().isoformat()
+                messages: dict[tuple[str, ...], PreparedMessage] = {}
+
+                def prepare(symbols: tuple[str, ...]) -> PreparedMessage:
+                    if symbols not in messages:
+                        messages[symbols] = PreparedMessage(
+                            {
                                 "type": "update",
-                                "timestamp": datetime.now().isoformat(),
-                                "data": updated_data,
+                                "timestamp": timestamp,
+                                "data": [changed[symbol] for symbol in symbols],
                             }
-                            # Get websockets for client IDs
-                            # Map client IDs to websockets
-                            websockets_to_send = []
-                            for (
-                                websocket,
-                                client_info,
-                            ) in self.connection_manager.active_connections.items():
-                                if client_info["id"] == client_id:
-                                    websockets_to_send.append(websocket)
-
-                            if websockets_to_send:
-                                task = self.connection_manager.broadcast(
-                                    message, websockets_to_send
-                                )
-                                update_tasks.append(task)
+                        )
+                    return messages[symbols]
+
+                update_tasks = [self.handle_refresh(websocket) for websocket in resync]
+                for symbols, websockets_to_send in groups.items():
+                    update_tasks.append(
+                        self.connection_manager.broadcast_serialized(
+                            prepare(symbols), websockets_to_send
+                        )
+                    )
+
+                # SSE subscribers share the JSON text of the matching WebSocket payload
+                for queue, stream_symbols in event_streams:
+                    wanted = {s.upper() for s in stream_symbols} or default_symbols
+                    symbols = tuple(symbol for symbol in changed if symbol in wanted)
+                    if symbols:
+                        self._publish_event(queue, prepare(symbols).text)
 
                 # Execute all client updates concurrently
                 if update_tasks:
                     await asyncio.gather(*update_tasks, return_exceptions=True)
 
+                # Followers are paced by the leader's ticks
+                if self.stream_leader_token is None:
+                    continue
+
                 # Wait before next update - adaptive timing based on number of symbols
                 update_interval = max(
                     5, 15 - len(unique_symbols) // 10
@@ -864,6 +1099,12 @@ async def websocket_endpoint(websocket: WebSocket, token: str = Query(None)):
         if not client_id:
             await websocket.close(code=1008, reason="Invalid token")
             return
+    else:
+        # Browsers authenticate with the httpOnly session cookie (?token= is for API
+        # clients); an expired session continues anonymously instead of being rejected
+        session_token = websocket.cookies.get(SecurityConfig.SESSION_COOKIE_NAME)
+        if session_token:
+            client_id = AuthManager.verify_token(session_token)
 
     # If no token provided, generate a temporary client ID
     if not client_id:
@@ -874,12 +1115,17 @@ async def websocket_endpoint(websocket: WebSocket, token: str = Query(None)):
     if not connected_client_id:
         return
 
-    # Metrics: new connection
+    # Metrics: new connection (lifespan stores the monitoring service on app.state)
     connections_total.inc()
     connections_active.inc()
+    monitoring_service = getattr(websocket.app.state, "monitoring", None) or get_monitoring_service()
+    monitoring_service.increment_active_connections()
 
     heartbeat_task = None
     try:
+        # Full snapshot on (re)connect; data_stream_worker then sends only changed assets
+        await websocket_manager.handle_refresh(websocket)
+
         # Start heartbeat task
         heartbeat_task = asyncio.create_task(heartbeat_worker(websocket))
 
@@ -910,6 +1156,7 @@ async def websocket_endpoint(websocket: WebSocket, token: str = Query(None)):
             heartbeat_task.cancel()
         await websocket_manager.disconnect(websocket)
         connections_active.dec()
+        monitoring_service.decrement_active_connections()
 
 
 async def heartbeat_worker(websocket):
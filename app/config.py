@@ -47,6 +47,18 @@ class SecurityConfig:
     PASSWORD_RESET_TOKEN_EXPIRE_HOURS = 1
     EMAIL_VERIFICATION_TOKEN_EXPIRE_HOURS = 24
 
+    # Browser session cookie (httpOnly access token used by the dashboard WebSocket)
+    SESSION_COOKIE_NAME = os.getenv("SESSION_COOKIE_NAME", "session")
+    SESSION_COOKIE_SECURE = os.getenv("SESSION_COOKIE_SECURE", "true").lower() == "true"
+
+    # CORS: comma-separated origins; the dashboard itself is same-origin and needs none
+    ALLOWED_ORIGINS = [
+        origin.strip() for origin in os.getenv("ALLOWED_ORIGINS", "*").split(",") if origin.strip()
+    ]
+    CORS_ALLOW_METHODS = ["GET", "POST", "PUT", "DELETE"]
+    CORS_ALLOW_HEADERS = ["content-type", "authorization"]
+    CORS_MAX_AGE = 86400  # Preflight results cached by the browser for a day
+
 
 class CacheConfig:
     """Cache configuration settings"""
@@ -59,6 +71,8 @@ class CacheConfig:
     MARKET_HOURS_TTL = 30  # During market hours
     OFF_HOURS_TTL = 300  # Outside market hours
     REDIS_TTL_MULTIPLIER = 2  # Redis stores data longer than memory cache
+    # In-process L1 TTL in front of Redis; kept short so writes from other workers show up
+    L1_TTL = int(os.getenv("CACHE_L1_TTL", "4"))
 
     # LRU Cache settings
     LRU_MAX_SIZE = 500  # Reduced from 2000 for better memory efficiency
@@ -1,16 +1,23 @@
 """Connection manager for handling WebSocket connections"""
 
 import asyncio
-import json
 import logging
+import time
 import uuid
-from collections import deque
 from datetime import datetime, timedelta
 from typing import Any
 
 from fastapi import WebSocket
 
 from app.services.metrics_collector import MetricsCollector
+from app.utils.serialization import (
+    MSGPACK_AVAILABLE,
+    PreparedMessage,
+    batch_frame_packed,
+    batch_frame_text,
+    deflate,
+    dumps_str,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,9 +27,11 @@ HEARTBEAT_INTERVAL = 10
 CLIENT_TIMEOUT = 30
 
 # Backpressure settings
-MAX_QUEUE_SIZE = 100  # Maximum messages queued per client
+MAX_QUEUE_SIZE = 64  # Maximum messages queued per client (oldest dropped, then resynced)
+SLOW_CLIENT_TIMEOUT = 10  # Seconds a queue may stay full before the client is dropped
+MAX_FRAME_BATCH = 128  # Messages coalesced into one frame (bounds frame size if the queue grows)
 MAX_BROADCAST_QUEUE_SIZE = 10000  # Total broadcast queue limit
-BATCH_SIZE = 100  # Batch size for broadcast
+BROADCAST_BATCH_SIZE = 50  # Clients per broadcast chunk before yielding to the event loop
 
 
 class ConnectionManager:
@@ -45,8 +54,9 @@ class ConnectionManager:
         # Shutdown event for graceful shutdown
         self.shutdown_event = asyncio.Event()
         
-        # Backpressure tracking
-        self.client_message_queues: dict[WebSocket, deque] = {}
+        # Backpressure: per-client outgoing queue drained by a dedicated sender task
+        self.client_message_queues: dict[WebSocket, asyncio.Queue] = {}
+        self.client_sender_tasks: dict[WebSocket, asyncio.Task] = {}
         self.broadcast_queue_size = 0
         self._queue_lock = asyncio.Lock()
 
@@ -75,7 +85,8 @@ class ConnectionManager:
             client_id = str(uuid.uuid4())
 
         try:
-            await websocket.accept()
+            protocol = self._select_subprotocol(websocket)
+            await websocket.accept(subprotocol=protocol)
 
             # Store client info
             self.active_connections[websocket] = {
@@ -83,10 +94,15 @@ class ConnectionManager:
                 "connected_at": datetime.now(),
                 "last_heartbeat": datetime.now(),
                 "timeframe": "5m",
+                "protocol": protocol or "json",
             }
             
-            # Initialize message queue for backpressure tracking
-            self.client_message_queues[websocket] = deque(maxlen=MAX_QUEUE_SIZE)
+            # Initialize outgoing queue and its sender task
+            queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
+            self.client_message_queues[websocket] = queue
+            self.client_sender_tasks[websocket] = asyncio.create_task(
+                self._client_sender(websocket, queue)
+            )
 
             self.metrics.increment_connections()
             logger.info(
@@ -99,6 +115,28 @@ class ConnectionManager:
             logger.error(f"WebSocket connection error for client {client_id}: {e}")
             return None
 
+    @staticmethod
+    def _select_subprotocol(websocket: WebSocket) -> str | None:
+        """
+        Pick the wire format from the subprotocols offered by the client
+
+        Args:
+            websocket: WebSocket connection
+
+        Returns:
+            "msgpack" (if offered and installed), "json.deflate" (JSON compressed once
+            per broadcast), "json" (if offered) or None
+        """
+        scope = getattr(websocket, "scope", None)
+        requested = scope.get("subprotocols", []) if isinstance(scope, dict) else []
+        if "msgpack" in requested and MSGPACK_AVAILABLE:
+            return "msgpack"
+        if "json.deflate" in requested:
+            return "json.deflate"
+        if "json" in requested:
+            return "json"
+        return None
+
     async def disconnect(self, websocket: WebSocket) -> None:
         """
         Handle WebSocket disconnection
@@ -114,9 +152,11 @@ class ConnectionManager:
         if websocket in self.active_connections:
             del self.active_connections[websocket]
         
-        # Remove message queue
-        if websocket in self.client_message_queues:
-            del self.client_message_queues[websocket]
+        # Remove message queue and stop its sender (unless we are running inside it)
+        self.client_message_queues.pop(websocket, None)
+        sender_task = self.client_sender_tasks.pop(websocket, None)
+        if sender_task is not None and sender_task is not asyncio.current_task():
+            sender_task.cancel()
 
         # Close the WebSocket
         try:
@@ -131,28 +171,24 @@ class ConnectionManager:
 
     async def send_message(self, websocket: WebSocket, message: dict) -> bool:
         """
-        Send message to a specific client with backpressure tracking
+        Send a reply to a specific client
+
+        Registered clients get it through their queue, behind frames already queued
+        (e.g. a snapshot), so their sender task stays the only writer on the socket.
 
         Args:
             websocket: WebSocket connection
             message: Message to send
 
         Returns:
-            True if successful, False otherwise
+            True if queued (or sent), False otherwise
         """
+        if websocket in self.client_message_queues:
+            return await self._send_to_client(websocket, PreparedMessage(message))
+
+        # Connection not registered through connect(): send directly
         try:
-            # Track message in queue
-            if websocket in self.client_message_queues:
-                queue = self.client_message_queues[websocket]
-                queue.append(datetime.now())
-                
-                # Check if client is too slow (queue full)
-                if len(queue) >= MAX_QUEUE_SIZE:
-                    logger.warning(f"Client {self.active_connections.get(websocket, {}).get('id', 'unknown')} is too slow, disconnecting")
-                    await self.disconnect(websocket)
-                    return False
-            
-            message_str = json.dumps(message)
+            message_str = dumps_str(message)
             await asyncio.wait_for(websocket.send_text(message_str), timeout=5.0)
             self.metrics.record_message_sent()
             return True
@@ -171,6 +207,25 @@ class ConnectionManager:
             message: Message to broadcast
             websockets: List of websockets to send to (None for all active connections)
         """
+        # Encodings are computed once and shared by every client
+        await self.broadcast_serialized(PreparedMessage(message), websockets)
+
+    async def broadcast_serialized(
+        self, message: PreparedMessage | str, websockets: list[WebSocket] | None = None
+    ) -> None:
+        """
+        Broadcast a prepared message to multiple clients
+
+        Each wire format (JSON text / MessagePack) is encoded at most once and the
+        same frame is reused for every socket.
+
+        Args:
+            message: Prepared message or already serialized JSON text
+            websockets: List of websockets to send to (None for all active connections)
+        """
+        if isinstance(message, str):
+            message = PreparedMessage(text=message)
+
         # If no specific websockets provided, send to all active connections
         if websockets is None:
             websockets = list(self.active_connections.keys())
@@ -182,59 +237,160 @@ class ConnectionManager:
                 return
             self.broadcast_queue_size += len(websockets)
 
-        # Pre-serialize message to avoid repeated serialization
-        message_str = json.dumps(message)
+        try:
+            if len(websockets) <= BROADCAST_BATCH_SIZE:
+                # Fast path: one gather, no extra event loop turn
+                await self._send_batch(websockets, message)
+            else:
+                for i in range(0, len(websockets), BROADCAST_BATCH_SIZE):
+                    await self._send_batch(websockets[i : i + BROADCAST_BATCH_SIZE], message)
+                    # Yield between chunks so HTTP handlers and Redis I/O are not starved
+                    if i + BROADCAST_BATCH_SIZE < len(websockets):
+                        await asyncio.sleep(0)
+        finally:
+            # Update broadcast queue size
+            async with self._queue_lock:
+                self.broadcast_queue_size -= len(websockets)
+
+    async def _send_batch(self, batch: list[WebSocket], message: PreparedMessage) -> None:
+        """
+        Send a message to a chunk of clients concurrently and drop failed ones
+
+        Args:
+            batch: WebSocket connections in this chunk
+            message: Prepared message
+        """
+        results = await asyncio.gather(
+            *(self._send_to_client(websocket, message) for websocket in batch),
+            return_exceptions=True,
+        )
+
+        # Remove disconnected clients
+        for websocket, result in zip(batch, results):
+            if isinstance(result, Exception) or result is False:
+                await self.disconnect(websocket)
 
-        # Process all clients concurrently with batching
-        for i in range(0, len(websockets), BATCH_SIZE):
-            batch = websockets[i : i + BATCH_SIZE]
-            broadcast_tasks = []
-            for websocket in batch:
-                task = self._send_to_client(websocket, message_str)
-                broadcast_tasks.append(task)
+    async def _send_to_client(self, websocket: WebSocket, message: PreparedMessage) -> bool:
+        """
+        Queue message for a specific client
 
-            # Gather all results concurrently
-            results = await asyncio.gather(*broadcast_tasks, return_exceptions=True)
+        The client's sender task writes it out. When the queue is full the oldest
+        message is dropped and, since stream ticks carry only changed assets, the client
+        is flagged with "needs_snapshot" so the next tick sends it the full state instead;
+        a queue that stays full for SLOW_CLIENT_TIMEOUT seconds means a dead or
+        hopelessly slow peer.
 
-            # Handle disconnected clients
-            disconnected_clients = []
-            for j, result in enumerate(results):
-                if isinstance(result, Exception) or result is False:
-                    disconnected_clients.append(batch[j])
+        Args:
+            websocket: WebSocket connection
+            message: Prepared message
 
-            # Remove disconnected clients
-            for websocket in disconnected_clients:
-                await self.disconnect(websocket)
+        Returns:
+            True if queued (or sent), False otherwise
+        """
+        queue = self.client_message_queues.get(websocket)
+        if queue is None:
+            # Connection not registered through connect(): send directly
+            try:
+                await asyncio.wait_for(websocket.send_text(message.text), timeout=1.0)
+                self.metrics.record_message_sent()
+                return True
+            except TimeoutError:
+                logger.warning("Client timeout during broadcast")
+                return False
+            except Exception as e:
+                logger.error(f"Error sending message to client: {e}")
+                return False
 
-            # Small delay between batches to prevent overwhelming the system
-            if i + BATCH_SIZE < len(websockets):
-                await asyncio.sleep(0.01)
-        
-        # Update broadcast queue size
-        async with self._queue_lock:
-            self.broadcast_queue_size -= len(websockets)
+        info = self.active_connections.get(websocket, {})
+        if not queue.full():
+            info.pop("queue_full_since", None)
+            queue.put_nowait(message)
+            return True
 
-    async def _send_to_client(self, websocket: WebSocket, message_str: str) -> bool:
+        now = time.monotonic()
+        full_since = info.setdefault("queue_full_since", now)
+        if now - full_since > SLOW_CLIENT_TIMEOUT:
+            logger.warning(f"Client {info.get('id', 'unknown')} is too slow, disconnecting")
+            return False
+
+        # Drop the oldest message to make room for the newest; the lost delta is
+        # recovered by a full snapshot (see send_snapshot)
+        queue.get_nowait()
+        queue.put_nowait(message)
+        info["needs_snapshot"] = True
+        return True
+
+    async def send_snapshot(self, websocket: WebSocket, message: dict) -> bool:
         """
-        Send message to a specific client
+        Queue a full-state message, replacing everything still queued for the client
+
+        Queued deltas are older than the snapshot, so they are discarded rather than
+        delivered after it.
 
         Args:
             websocket: WebSocket connection
-            message_str: Serialized message string
+            message: Snapshot message
 
         Returns:
-            True if successful, False otherwise
+            True if queued (or sent), False otherwise
+        """
+        queue = self.client_message_queues.get(websocket)
+        if queue is None:
+            # Connection not registered through connect(): send directly
+            return await self.send_message(websocket, message)
+
+        while not queue.empty():
+            queue.get_nowait()
+        info = self.active_connections.get(websocket, {})
+        info.pop("queue_full_since", None)
+        info.pop("needs_snapshot", None)
+        queue.put_nowait(PreparedMessage(message))
+        return True
+
+    async def _client_sender(self, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        """
+        Per-client sender: drain everything queued and send it as one frame
+
+        Args:
+            websocket: WebSocket connection
+            queue: Client's outgoing message queue
         """
         try:
-            await asyncio.wait_for(websocket.send_text(message_str), timeout=1.0)  # Reduced timeout
-            self.metrics.record_message_sent()
-            return True
-        except TimeoutError:
-            logger.warning("Client timeout during broadcast")
-            return False
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < MAX_FRAME_BATCH:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                # Items are already encoded, batches splice them without re-encoding
+                protocol = self.active_connections.get(websocket, {}).get("protocol")
+                if protocol == "msgpack":
+                    if len(batch) == 1:
+                        frame = batch[0].packed
+                    else:
+                        frame = batch_frame_packed([message.packed for message in batch])
+                    await asyncio.wait_for(websocket.send_bytes(frame), timeout=5.0)
+                elif protocol == "json.deflate":
+                    if len(batch) == 1:
+                        # Compressed once and shared by every client
+                        frame = batch[0].deflated
+                    else:
+                        frame = deflate(batch_frame_text([message.text for message in batch]))
+                    await asyncio.wait_for(websocket.send_bytes(frame), timeout=5.0)
+                else:
+                    if len(batch) == 1:
+                        frame = batch[0].text
+                    else:
+                        frame = batch_frame_text([message.text for message in batch])
+                    await asyncio.wait_for(websocket.send_text(frame), timeout=5.0)
+                self.metrics.record_message_sent()
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logger.error(f"Error sending message to client: {e}")
-            return False
+            logger.warning(f"Error sending queued messages to client: {e}")
+            await self.disconnect(websocket)
 
     def get_client_id(self, websocket: WebSocket) -> str | None:
         """
@@ -4,7 +4,7 @@ Approach:
 - Token bucket per (client_key, normalized_path) with sliding window refill.
 - Client key derived from Authorization token hash or IP address.
 - Uses Redis if available (via redis_cache_service) else process-local memory dictionary.
-- Excludes safe endpoints: /health, /metrics, /docs, /redoc.
+- Excludes safe endpoints: /health, /metrics, /docs, /redoc, /static/.
 - On limit exceeded raises RateLimitError caught by ExceptionHandlerMiddleware.
 """
 
@@ -31,6 +31,7 @@ _EXCLUDED_PREFIXES = [
     "/docs",
     "/redoc",
     "/openapi.json",
+    "/static/",
 ]
 
 
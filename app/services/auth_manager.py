@@ -40,6 +40,10 @@ class AuthManager:
             client_id = payload.get("sub")
             if isinstance(client_id, str):
                 return client_id
+            # Access tokens issued by /api/users/login carry user_id instead of sub
+            user_id = payload.get("user_id")
+            if user_id is not None:
+                return str(user_id)
             return None
         except JWTError as e:
             logger.warning(f"Invalid token: {e}")
@@ -58,6 +58,15 @@ ALGORITHM = SecurityConfig.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = SecurityConfig.ACCESS_TOKEN_EXPIRE_MINUTES
 REFRESH_TOKEN_EXPIRE_DAYS = SecurityConfig.REFRESH_TOKEN_EXPIRE_DAYS
 
+# Validation patterns compiled once at import
+_UPPERCASE_RE = re.compile(r"[A-Z]")
+_LOWERCASE_RE = re.compile(r"[a-z]")
+_DIGIT_RE = re.compile(r"\d")
+_SPECIAL_RE = re.compile(r"[!@#$%^&*(),.?\":{}|<>]")
+_REPEAT_RE = re.compile(r"(.)\1{2,}")
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_USERNAME_RE = re.compile(r"^[a-zA-Z0-9_]+$")
+
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/users/login")
 
@@ -164,16 +173,16 @@ class AuthService:
                 f"Password must be less than {SecurityConfig.MAX_PASSWORD_LENGTH} characters long",
             )
 
-        if not re.search(r"[A-Z]", password):
+        if not _UPPERCASE_RE.search(password):
             return False, "Password must contain at least one uppercase letter (A-Z)"
 
-        if not re.search(r"[a-z]", password):
+        if not _LOWERCASE_RE.search(password):
             return False, "Password must contain at least one lowercase letter (a-z)"
 
-        if not re.search(r"\d", password):
+        if not _DIGIT_RE.search(password):
             return False, "Password must contain at least one digit (0-9)"
 
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
+        if not _SPECIAL_RE.search(password):
             return (
                 False,
                 'Password must contain at least one special character (!@#$%^&*(),.?":{}|<>)',
@@ -195,7 +204,7 @@ class AuthService:
             return False, "Password is too common and weak. Please choose a stronger password."
 
         # Check for repetitive characters
-        if re.search(r"(.)\1{2,}", password):
+        if _REPEAT_RE.search(password):
             return False, "Password contains too many repetitive characters (e.g., aaa, 111)"
 
         return True, "Password is valid"
@@ -203,15 +212,14 @@ class AuthService:
     @staticmethod
     def validate_email(email: str) -> bool:
         """Validate email format"""
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
 
     @staticmethod
     def validate_username(username: str) -> bool:
         """Validate username format"""
         if not username or len(username) < 3 or len(username) > 50:
             return False
-        return bool(re.match(r"^[a-zA-Z0-9_]+$", username))
+        return bool(_USERNAME_RE.match(username))
 
     @staticmethod
     def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
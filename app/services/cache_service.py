@@ -6,8 +6,10 @@ compression for large data, partitioning for better organization, and comprehens
 statistics tracking.
 
 The cache service implements a two-tier approach:
-1. Redis cache (persistent, shared across instances)
-2. Memory cache (fast, instance-local)
+1. Memory cache (L1, instance-local, short TTL in front of Redis)
+2. Redis cache (L2, persistent, shared across instances)
+
+While Redis is unavailable the memory cache serves items for their full TTL.
 
 Key Features:
 - Dual-layer caching (Redis + memory)
@@ -22,7 +24,6 @@ Classes:
 """
 
 import asyncio
-import json
 import logging
 import time
 import zlib
@@ -37,6 +38,9 @@ from app.exceptions.custom_exceptions import CacheError
 # Import Redis cache service
 from app.services.redis_cache_service import get_redis_cache_service
 
+# Import fast JSON serialization
+from app.utils.serialization import dumps, loads
+
 # Import types
 from app.utils.types import CacheStats
 
@@ -76,19 +80,21 @@ class CacheService:
         self.misses = 0
         self.errors = 0
         self.compression_threshold = CacheConfig.COMPRESSION_THRESHOLD
+        # L1 entries are trusted without asking Redis for this long
+        self.l1_ttl = CacheConfig.L1_TTL
         # Pre-warmed cache for frequently accessed data
         self.pre_warmed = False
 
-    def _compress_value(self, value: Any) -> bytes:
-        """Compress value if it's large enough"""
+    def _compress_value(self, value: Any) -> bytes | None:
+        """Compress value if it's large enough (None if it cannot be serialized)"""
         try:
-            serialized = json.dumps(value, default=str)
-            if len(serialized) > self.compression_threshold:
-                return zlib.compress(serialized.encode("utf-8"))
-            return serialized.encode("utf-8")
-        except Exception as e:
-            logger.warning(f"Failed to compress value: {e}")
-            return json.dumps(value, default=str).encode("utf-8")
+            serialized = dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Failed to serialize value for cache: {e}")
+            return None
+        if len(serialized) > self.compression_threshold:
+            return zlib.compress(serialized)
+        return serialized
 
     def _decompress_value(self, data: bytes | str) -> Any:
         """Decompress value if it's compressed"""
@@ -96,20 +102,19 @@ class CacheService:
             if isinstance(data, bytes):
                 # Try to decompress first
                 try:
-                    decompressed = zlib.decompress(data)
-                    return json.loads(decompressed.decode("utf-8"))
+                    return loads(zlib.decompress(data))
                 except zlib.error:
-                    # Not compressed, treat as regular string
-                    return json.loads(data.decode("utf-8"))
+                    # Not compressed, treat as regular JSON bytes
+                    return loads(data)
             else:
-                return json.loads(data)
+                return loads(data)
         except Exception as e:
             logger.warning(f"Failed to decompress value: {e}")
             return data
 
     async def get(self, key: str) -> Any | None:
         """
-        Get value from cache (Redis first, then memory) with enhanced performance
+        Get value from cache (L1 memory, then Redis, then memory fallback)
 
         Args:
             key: Cache key
@@ -118,13 +123,27 @@ class CacheService:
             Cached value or None if not found or expired
         """
         try:
-            # Try Redis first
+            # L1: fresh in-process entry, no Redis round-trip
+            now = time.time()
+            item = self.memory_cache.get(key)
+            if (
+                isinstance(item, dict)
+                and now < item.get("l1_expires_at", 0)
+                and now < item["expires_at"]
+            ):
+                self.hits += 1
+                logger.debug(f"L1 cache hit for key: {key}")
+                return item["value"]
+
+            # L2: Redis
             redis_value = await self.redis_cache.get(key)
             if redis_value is not None:
                 self.hits += 1
                 logger.debug(f"Redis cache hit for key: {key}")
                 # Decompress if needed
-                return self._decompress_value(redis_value)
+                value = self._decompress_value(redis_value)
+                self._promote_to_l1(key, value, len(redis_value))
+                return value
 
             # Fall back to memory cache (LRUCache)
             async with self.lock:
@@ -161,6 +180,24 @@ class CacheService:
                 logger.error(f"Error in cache fallback for key {key}: {fallback_error}")
             return None
 
+    def _promote_to_l1(self, key: str, value: Any, size: int) -> None:
+        """Store a value fetched from Redis in the memory cache for the L1 TTL"""
+        now = time.time()
+        item = self.memory_cache.get(key)
+        expires_at = now + self.l1_ttl
+        if isinstance(item, dict) and "expires_at" in item:
+            expires_at = max(expires_at, item["expires_at"])
+        self.memory_cache.set(
+            key,
+            {
+                "value": value,
+                "expires_at": expires_at,
+                "l1_expires_at": now + self.l1_ttl,
+                "created_at": now,
+                "size": size,
+            },
+        )
+
     async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
         """
         Set value in cache (both Redis and memory) with enhanced performance
@@ -179,6 +216,10 @@ class CacheService:
 
         # Compress large values
         compressed_value = self._compress_value(value)
+        if compressed_value is None:
+            # Not cacheable: the caller still has its value, only caching is skipped
+            self.errors += 1
+            return False
 
         try:
             # Set in Redis with compression
@@ -192,13 +233,15 @@ class CacheService:
         try:
             # Set in memory cache (LRUCache)
             async with self.lock:
-                expires_at = time.time() + ttl_to_use
+                now = time.time()
                 self.memory_cache.set(
                     key,
                     {
                         "value": value,  # Store original value in memory
-                        "expires_at": expires_at,
-                        "created_at": time.time(),
+                        "expires_at": now + ttl_to_use,
+                        # L1 TTL is always shorter than the Redis TTL
+                        "l1_expires_at": now + min(ttl_to_use, self.l1_ttl),
+                        "created_at": now,
                         "size": len(compressed_value),
                     }
                 )
@@ -29,6 +29,7 @@ from datetime import datetime, timedelta
 from functools import wraps
 
 import aiohttp
+import numpy as np
 import pandas as pd
 
 # Import custom exceptions
@@ -44,16 +45,74 @@ from app.exceptions.custom_exceptions import (
 from app.services.cache_service import get_cache_service
 
 # Import types
+from app.utils.downsample import lttb_downsample
 from app.utils.types import AssetData
 
 logger = logging.getLogger(__name__)
 
+# Upstream HTTP connection pool (shared aiohttp session)
+HTTP_POOL_LIMIT = 100
+HTTP_POOL_LIMIT_PER_HOST = 20
+HTTP_KEEPALIVE_TIMEOUT = 60  # seconds; outlives the data refresh interval
+
 # Use centralized safe import for yfinance
 from app.utils.yfinance_safe import get_yf
 
 yf = get_yf()
 
 
+def _ohlc_chart_points(df: pd.DataFrame, fallback_price: float) -> list[dict]:
+    """
+    Convert a yfinance history frame into chart points column by column
+
+    Each column is converted once as a whole instead of per row (DataFrame.iterrows
+    builds a Series for every bar). Missing, non-numeric or infinite values fall back
+    to ``fallback_price`` (0 for volume) one by one; a column that still cannot be
+    converted falls back as a whole, keeping the other columns.
+
+    Args:
+        df: History frame with Open/High/Low/Close/Volume columns
+        fallback_price: Price used for missing OHLC values
+
+    Returns:
+        List of {"time", "open", "high", "low", "close", "volume"} points
+    """
+    size = len(df)
+
+    def column(name: str, fallback: float) -> list:
+        if name not in df.columns:
+            return [fallback] * size
+        try:
+            values = pd.to_numeric(df[name], errors="coerce")
+            values = values.where(np.isfinite(values), fallback)
+            if name == "Volume":
+                # astype("int64") silently wraps values outside the int64 range
+                values = values.where(values.abs() < 2**63, fallback)
+                return values.astype("int64").tolist()
+            return values.astype("float64").tolist()
+        except (ValueError, TypeError, OverflowError) as e:
+            logger.warning(f"Invalid {name} values in history, using fallback: {e}")
+            return [fallback] * size
+
+    opens = column("Open", fallback_price)
+    highs = column("High", fallback_price)
+    lows = column("Low", fallback_price)
+    closes = column("Close", fallback_price)
+    volumes = column("Volume", 0)
+
+    return [
+        {
+            "time": str(idx),
+            "open": opens[i],
+            "high": highs[i],
+            "low": lows[i],
+            "close": closes[i],
+            "volume": volumes[i],
+        }
+        for i, idx in enumerate(df.index)
+    ]
+
+
 def retry_on_failure(
     max_retries: int = 5,
     delay: float = 1.0,
@@ -138,17 +197,31 @@ class DataFetcher:
         }
         self._session_lock = asyncio.Lock()
         self._http_session = None
+        # Snapshot of the last batched CoinGecko simple/price response: coin_id -> (ts, data)
+        self._crypto_price_snapshot: dict[str, tuple[float, dict]] = {}
+        self.crypto_price_snapshot_ttl = 30
+        self.crypto_chart_ttl = 60
+        self.crypto_price_batch_size = 100
 
     async def _get_http_session(self):
         """Get or create aiohttp ClientSession (singleton pattern)"""
         if self._http_session is None or self._http_session.closed:
             async with self._session_lock:
                 if self._http_session is None or self._http_session.closed:
-                    timeout = aiohttp.ClientTimeout(total=15)
+                    timeout = aiohttp.ClientTimeout(total=15, connect=5)
                     headers = {
                         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                     }
-                    self._http_session = aiohttp.ClientSession(headers=headers, timeout=timeout)
+                    # Bounded keep-alive pool: repeated fetches reuse TCP/TLS sessions
+                    connector = aiohttp.TCPConnector(
+                        limit=HTTP_POOL_LIMIT,
+                        limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+                        ttl_dns_cache=300,
+                        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                    )
+                    self._http_session = aiohttp.ClientSession(
+                        headers=headers, timeout=timeout, connector=connector
+                    )
         return self._http_session
 
     async def close(self):
@@ -160,26 +233,24 @@ class DataFetcher:
         """Initialize cache warming for frequently accessed assets"""
         logger.info("Initializing cache warming for frequently accessed assets")
         try:
-            # Fetch initial data for frequently accessed assets
+            # Fetch all assets concurrently: startup cost is max(t_i) instead of sum(t_i)
+            asset_keys = list(self.frequently_accessed_assets)
+            coin_ids = [key.split("_")[1] for key in asset_keys if key.startswith("crypto_")]
+            if coin_ids:
+                # One batched price request instead of one per coin
+                await self.prefetch_crypto_prices(coin_ids)
+
+            results = await asyncio.gather(
+                *(self._fetch_warm_asset(asset_key) for asset_key in asset_keys),
+                return_exceptions=True,
+            )
+
             warm_data = {}
-            for asset_key in self.frequently_accessed_assets:
-                if asset_key.startswith("stock_"):
-                    parts = asset_key.split("_")
-                    symbol = parts[1]
-                    try:
-                        data = await self.get_stock_data(symbol)
-                        if data:
-                            warm_data[asset_key] = data
-                    except Exception as e:
-                        logger.warning(f"Failed to warm cache for {asset_key}: {e}")
-                elif asset_key.startswith("crypto_"):
-                    coin_id = asset_key.split("_")[1]
-                    try:
-                        data = await self.get_crypto_data(coin_id)
-                        if data:
-                            warm_data[asset_key] = data
-                    except Exception as e:
-                        logger.warning(f"Failed to warm cache for {asset_key}: {e}")
+            for asset_key, result in zip(asset_keys, results):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Failed to warm cache for {asset_key}: {result}")
+                elif result:
+                    warm_data[asset_key] = result
 
             # Warm the cache
             warmed_count = await self.cache_service.warm_cache(warm_data)
@@ -187,6 +258,14 @@ class DataFetcher:
         except Exception as e:
             logger.error(f"Error during cache warming initialization: {e}")
 
+    async def _fetch_warm_asset(self, asset_key: str) -> AssetData | None:
+        """Fetch data for a single cache warming key (stock_<SYMBOL>_... / crypto_<id>)"""
+        if asset_key.startswith("stock_"):
+            return await self.get_stock_data(asset_key.split("_")[1])
+        if asset_key.startswith("crypto_"):
+            return await self.get_crypto_data(asset_key.split("_")[1])
+        return None
+
     async def _check_rate_limit(self):
         """Check and enforce rate limiting with more conservative approach"""
         now = time.time()
@@ -362,7 +441,7 @@ class DataFetcher:
                 chart_data_limit = 100
                 chart_data_full = []
 
-                # Process data row by row with validation
+                # Convert the history frame with validation
                 try:
                     # Handle mock data that might not be iterable
                     if not hasattr(df, "iterrows"):
@@ -379,80 +458,7 @@ class DataFetcher:
                                 }
                             )
                     else:
-                        for idx, row in df.iterrows():
-                            try:
-                                # Handle pandas Series values safely
-                                open_val = current_price
-                                if "Open" in df.columns:
-                                    try:
-                                        open_series = row["Open"]
-                                        if open_series is not None and not (
-                                            isinstance(open_series, float) and pd.isna(open_series)
-                                        ):
-                                            open_val = float(open_series)
-                                    except (ValueError, TypeError):
-                                        pass
-
-                                high_val = current_price
-                                if "High" in df.columns:
-                                    try:
-                                        high_series = row["High"]
-                                        if high_series is not None and not (
-                                            isinstance(high_series, float) and pd.isna(high_series)
-                                        ):
-                                            high_val = float(high_series)
-                                    except (ValueError, TypeError):
-                                        pass
-
-                                low_val = current_price
-                                if "Low" in df.columns:
-                                    try:
-                                        low_series = row["Low"]
-                                        if low_series is not None and not (
-                                            isinstance(low_series, float) and pd.isna(low_series)
-                                        ):
-                                            low_val = float(low_series)
-                                    except (ValueError, TypeError):
-                                        pass
-
-                                close_val = current_price
-                                if "Close" in df.columns:
-                                    try:
-                                        close_series = row["Close"]
-                                        if close_series is not None and not (
-                                            isinstance(close_series, float)
-                                            and pd.isna(close_series)
-                                        ):
-                                            close_val = float(close_series)
-                                    except (ValueError, TypeError):
-                                        pass
-
-                                volume_val = 0
-                                if "Volume" in df.columns:
-                                    try:
-                                        volume_series = row["Volume"]
-                                        if volume_series is not None and not (
-                                            isinstance(volume_series, float)
-                                            and pd.isna(volume_series)
-                                        ):
-                                            volume_val = int(volume_series)
-                                    except (ValueError, TypeError):
-                                        pass
-
-                                chart_point = {
-                                    "time": str(idx),
-                                    "open": open_val,
-                                    "high": high_val,
-                                    "low": low_val,
-                                    "close": close_val,
-                                    "volume": volume_val,
-                                }
-                                chart_data_full.append(chart_point)
-                            except (ValueError, TypeError) as e:
-                                logger.warning(
-                                    f"Skipping invalid data point for {symbol} at {idx}: {e}"
-                                )
-                                continue
+                        chart_data_full = _ohlc_chart_points(df, current_price)
                 except Exception as e:
                     logger.warning(f"Error processing data for {symbol}: {e}")
                     # Create mock chart data as fallback
@@ -468,12 +474,8 @@ class DataFetcher:
                             }
                         )
 
-                # Limit chart data size
-                if len(chart_data_full) > chart_data_limit:
-                    step = len(chart_data_full) // chart_data_limit
-                    chart_data = chart_data_full[::step][:chart_data_limit]
-                else:
-                    chart_data = chart_data_full
+                # Limit chart data size (LTTB keeps spikes that stride sampling drops)
+                chart_data = lttb_downsample(chart_data_full, chart_data_limit, value_key="close")
 
                 data = {
                     "symbol": symbol,
@@ -585,36 +587,40 @@ class DataFetcher:
 
             session = await self._get_http_session()
             try:
-                # Current price
-                url = "https://api.coingecko.com/api/v3/simple/price"
-                params = {
-                    "ids": coin_id,
-                    "vs_currencies": "usd",
-                    "include_24hr_change": "true",
-                    "include_24hr_vol": "true",
-                    "include_market_cap": "true",
-                }
+                # Current price (reuse the batched snapshot when it is fresh)
+                coin_data = self._get_snapshot_price(coin_id)
+                if coin_data is None:
+                    url = "https://api.coingecko.com/api/v3/simple/price"
+                    params = {
+                        "ids": coin_id,
+                        "vs_currencies": "usd",
+                        "include_24hr_change": "true",
+                        "include_24hr_vol": "true",
+                        "include_market_cap": "true",
+                    }
 
-                async with session.get(url, params=params) as response:
-                    if response.status == 429:
-                        logger.warning(f"Rate limit exceeded for {coin_id}")
-                        raise RateLimitError(f"Rate limit exceeded for {coin_id}")
+                    async with session.get(url, params=params) as response:
+                        if response.status == 429:
+                            logger.warning(f"Rate limit exceeded for {coin_id}")
+                            raise RateLimitError(f"Rate limit exceeded for {coin_id}")
 
-                    if response.status != 200:
-                        logger.warning(f"HTTP {response.status} error for {coin_id}")
-                        # Try alternative endpoint
-                        data = await self._fetch_coingecko_alternative(session, coin_id, cache_key)
-                        if data:
-                            return data
-                        raise DataFetchError(f"HTTP {response.status} error for {coin_id}")
+                        if response.status != 200:
+                            logger.warning(f"HTTP {response.status} error for {coin_id}")
+                            # Try alternative endpoint
+                            data = await self._fetch_coingecko_alternative(
+                                session, coin_id, cache_key
+                            )
+                            if data:
+                                return data
+                            raise DataFetchError(f"HTTP {response.status} error for {coin_id}")
 
-                    price_data = await response.json()
+                        price_data = await response.json()
 
-                if not price_data or coin_id not in price_data:
-                    logger.warning(f"No price data returned for {coin_id}")
-                    return None
+                    if not price_data or coin_id not in price_data:
+                        logger.warning(f"No price data returned for {coin_id}")
+                        return None
 
-                coin_data = price_data[coin_id]
+                    coin_data = price_data[coin_id]
                 if "usd" not in coin_data:
                     logger.warning(f"Missing USD price data for {coin_id}")
                     data = await self._fetch_coingecko_alternative(session, coin_id, cache_key)
@@ -623,17 +629,7 @@ class DataFetcher:
                     raise DataValidationError(f"Missing USD price data for {coin_id}")
 
                 # Historical data
-                hist_url = f"https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart"
-                hist_params = {"vs_currency": "usd", "days": "1", "interval": "hourly"}
-
-                chart_data = []
-                try:
-                    async with session.get(hist_url, params=hist_params) as hist_response:
-                        if hist_response.status == 200:
-                            hist_data = await hist_response.json()
-                            chart_data = self._process_chart_data(hist_data.get("prices", []))
-                except Exception as e:
-                    logger.warning(f"Error processing historical data for {coin_id}: {e}")
+                chart_data = await self._fetch_coingecko_chart(session, coin_id)
 
                 data = {
                     "symbol": coin_id.upper(),
@@ -661,6 +657,95 @@ class DataFetcher:
                 logger.error(f"Error fetching data for {coin_id}: {e}")
                 raise DataFetchError(f"Failed to fetch data for {coin_id}: {e!s}")
 
+    def _get_snapshot_price(self, coin_id: str) -> dict | None:
+        """Return price data for a coin from the batched snapshot if it is still fresh"""
+        entry = self._crypto_price_snapshot.get(coin_id)
+        if entry is None:
+            return None
+        fetched_at, coin_data = entry
+        if time.time() - fetched_at > self.crypto_price_snapshot_ttl:
+            return None
+        return coin_data
+
+    async def prefetch_crypto_prices(self, coin_ids: list[str]) -> int:
+        """
+        Fetch current prices for many coins with a single CoinGecko simple/price call
+
+        CoinGecko accepts a comma-separated ``ids`` list, so one request per tick replaces
+        one request per coin. Results are kept in a short-lived snapshot that
+        ``_fetch_from_coingecko`` reads before falling back to a per-coin request.
+
+        Args:
+            coin_ids: CoinGecko coin identifiers
+
+        Returns:
+            Number of coins present in the response
+        """
+        ids = [
+            coin_id
+            for coin_id in dict.fromkeys(coin_ids)
+            if self._get_snapshot_price(coin_id) is None
+        ]
+        if not ids:
+            return 0
+
+        url = "https://api.coingecko.com/api/v3/simple/price"
+        session = await self._get_http_session()
+        fetched = 0
+        for i in range(0, len(ids), self.crypto_price_batch_size):
+            chunk = ids[i : i + self.crypto_price_batch_size]
+            params = {
+                "ids": ",".join(chunk),
+                "vs_currencies": "usd",
+                "include_24hr_change": "true",
+                "include_24hr_vol": "true",
+                "include_market_cap": "true",
+            }
+            try:
+                async with self.semaphore:
+                    await self._check_rate_limit()
+                    async with session.get(url, params=params) as response:
+                        if response.status != 200:
+                            logger.warning(f"HTTP {response.status} error for batched crypto prices")
+                            continue
+                        price_data = await response.json()
+            except Exception as e:
+                logger.warning(f"Batched crypto price request failed: {e}")
+                continue
+
+            now = time.time()
+            for coin_id, coin_data in (price_data or {}).items():
+                if isinstance(coin_data, dict) and "usd" in coin_data:
+                    self._crypto_price_snapshot[coin_id] = (now, coin_data)
+                    fetched += 1
+
+        logger.debug(f"Batched crypto prices fetched for {fetched}/{len(ids)} coins")
+        return fetched
+
+    async def _fetch_coingecko_chart(self, session, coin_id: str) -> list:
+        """Fetch hourly market chart for a coin, cached separately from the price"""
+        cache_key = f"crypto_chart_{coin_id}"
+        cached_chart = await self.cache_service.get(cache_key)
+        if cached_chart is not None:
+            return cached_chart
+
+        hist_url = f"https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart"
+        hist_params = {"vs_currency": "usd", "days": "1", "interval": "hourly"}
+
+        chart_data = []
+        try:
+            async with session.get(hist_url, params=hist_params) as hist_response:
+                if hist_response.status == 200:
+                    hist_data = await hist_response.json()
+                    chart_data = self._process_chart_data(hist_data.get("prices", []))
+        except Exception as e:
+            logger.warning(f"Error processing historical data for {coin_id}: {e}")
+
+        if chart_data:
+            # Hourly intraday data does not change faster than this
+            await self.cache_service.set(cache_key, chart_data, ttl=self.crypto_chart_ttl)
+        return chart_data
+
     async def _fetch_coingecko_alternative(self, session, coin_id: str, cache_key: str):
         """Fetch data from CoinGecko alternative endpoint"""
         alt_url = f"https://api.coingecko.com/api/v3/coins/{coin_id}"
@@ -704,18 +789,13 @@ class DataFetcher:
         if not raw_chart_data:
             return []
 
-        # Use slicing instead of loop for better performance
-        if len(raw_chart_data) > limit:
-            step = len(raw_chart_data) // limit
-            sampled = raw_chart_data[::step][:limit]
-        else:
-            sampled = raw_chart_data
+        valid = [point for point in raw_chart_data if len(point) >= 2 and point[1] is not None]
+        sampled = lttb_downsample(valid, limit, value_key=1)
 
         # List comprehension is faster than loop with append
         return [
             {"time": datetime.fromtimestamp(point[0] / 1000).isoformat(), "price": point[1]}
             for point in sampled
-            if len(point) >= 2 and point[1] is not None
         ]
 
     async def get_crypto_historical_data(self, coin_id: str, days: int = 30) -> AssetData | None:
@@ -957,6 +1037,9 @@ class DataFetcher:
 
         # Process crypto assets with larger batch sizes
         if crypto_assets:
+            # One simple/price request for every coin; per-coin fetches reuse the snapshot
+            await self.prefetch_crypto_prices([asset["symbol"] for asset in crypto_assets])
+
             crypto_batch_size = self.batch_sizes.get("crypto", 10)
             for i in range(0, len(crypto_assets), crypto_batch_size):
                 batch = crypto_assets[i : i + crypto_batch_size]
@@ -1,10 +1,26 @@
 """Delta manager for sending only changed data in WebSocket updates"""
 
 import logging
+import math
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Fields compared to decide whether an asset changed
+DELTA_FIELDS = ("current_price", "change_percent", "volume", "open", "high", "low")
+
+
+def _field_value(value: Any) -> float:
+    """Numeric field as float, NaN when missing or not numeric"""
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
 
 class DeltaManager:
     """Управление дельта-обновлениями"""
@@ -12,6 +28,10 @@ class DeltaManager:
     def __init__(self):
         """Initialize delta manager"""
         self.previous_data: dict[str, dict] = {}
+        # Batch (vectorized) state: symbol -> row in a persistent float64 matrix
+        self._rows: dict[str, int] = {}
+        self._free_rows: list[int] = []
+        self._values = np.full((0, len(DELTA_FIELDS)), np.nan)
 
     def get_delta(self, symbol: str, new_data: dict) -> dict | None:
         """
@@ -28,8 +48,7 @@ class DeltaManager:
         delta = {}
 
         # Compare key fields that typically change
-        key_fields = ["current_price", "change_percent", "volume", "open", "high", "low"]
-        for key in key_fields:
+        for key in DELTA_FIELDS:
             if key not in old_data or old_data[key] != new_data.get(key):
                 delta[key] = new_data.get(key)
 
@@ -39,6 +58,58 @@ class DeltaManager:
         # Return delta if there are changes, otherwise None
         return delta if delta else None
 
+    def changed_mask(self, assets: list[dict]) -> list[bool]:
+        """
+        Vectorized change detection for a whole tick of assets
+
+        Key fields of all assets are compared against the previous tick in a single
+        NumPy operation instead of a per-field Python loop. Prices are kept as float64:
+        float32 would round away small moves on large prices.
+
+        Args:
+            assets: Asset data dicts with a "symbol" key
+
+        Returns:
+            One flag per asset, True if it is new or any key field changed
+        """
+        if not assets:
+            return []
+
+        new_values = np.array(
+            [[_field_value(asset.get(field)) for field in DELTA_FIELDS] for asset in assets],
+            dtype=np.float64,
+        )
+        rows = np.empty(len(assets), dtype=np.intp)
+        is_new = np.zeros(len(assets), dtype=bool)
+        for i, asset in enumerate(assets):
+            row = self._rows.get(asset["symbol"])
+            if row is None:
+                row = self._allocate_row(asset["symbol"])
+                is_new[i] = True
+            rows[i] = row
+
+        old_values = self._values[rows]
+        same = (new_values == old_values) | (np.isnan(new_values) & np.isnan(old_values))
+        changed = is_new | ~same.all(axis=1)
+
+        self._values[rows] = new_values
+        return changed.tolist()
+
+    def _allocate_row(self, symbol: str) -> int:
+        """Assign a matrix row to a new symbol, growing the matrix geometrically"""
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self._rows[symbol] = row
+            return row
+
+        row = len(self._rows)
+        if row >= len(self._values):
+            grown = np.full((max(8, 2 * len(self._values)), len(DELTA_FIELDS)), np.nan)
+            grown[: len(self._values)] = self._values
+            self._values = grown
+        self._rows[symbol] = row
+        return row
+
     def clear_symbol_data(self, symbol: str) -> None:
         """
         Clear stored data for a specific symbol
@@ -48,10 +119,16 @@ class DeltaManager:
         """
         if symbol in self.previous_data:
             del self.previous_data[symbol]
+        row = self._rows.pop(symbol, None)
+        if row is not None:
+            self._free_rows.append(row)
 
     def clear_all_data(self) -> None:
         """Clear all stored data"""
         self.previous_data.clear()
+        self._rows.clear()
+        self._free_rows.clear()
+        self._values = np.full((0, len(DELTA_FIELDS)), np.nan)
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -60,4 +137,4 @@ class DeltaManager:
         Returns:
             Dictionary with statistics
         """
-        return {"tracked_symbols": len(self.previous_data)}
+        return {"tracked_symbols": len(self.previous_data.keys() | self._rows.keys())}
@@ -24,6 +24,10 @@ Supported Indicators:
 
 Classes:
     TechnicalIndicators: Main class for calculating technical indicators
+
+Indicators that pandas cannot vectorize (sequential state such as Parabolic SAR) run in
+plain loops over NumPy arrays, compiled with Numba when the optional ``numba`` package
+is installed.
 """
 
 import logging
@@ -33,6 +37,57 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Optional Numba JIT for sequential indicator loops; plain Python loops otherwise
+try:
+    from numba import njit  # type: ignore
+
+    NUMBA_AVAILABLE = True
+    _jit = njit(cache=True)
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def _jit(func):
+        return func
+
+
+@_jit
+def _parabolic_sar_kernel(high, low, acceleration, maximum):
+    """Run Parabolic SAR over the whole series; returns (sar, bullish, ep, af) of the last bar"""
+    sar = low[0]
+    bullish = True
+    ep = high[0]
+    af = acceleration
+    for i in range(1, len(high)):
+        sar = sar + af * (ep - sar)
+        if bullish:
+            if low[i] < sar:
+                # Trend reversal
+                bullish = False
+                sar = ep
+                ep = low[i]
+                af = acceleration
+            elif high[i] > ep:
+                ep = high[i]
+                af = min(af + acceleration, maximum)
+        else:
+            if high[i] > sar:
+                # Trend reversal
+                bullish = True
+                sar = ep
+                ep = high[i]
+                af = acceleration
+            elif low[i] < ep:
+                ep = low[i]
+                af = min(af + acceleration, maximum)
+    return sar, bullish, ep, af
+
+
+def warm_up() -> None:
+    """Compile (or load from the Numba cache) the JIT kernels before the first request"""
+    if NUMBA_AVAILABLE:
+        sample = np.array([1.0, 2.0, 1.5])
+        _parabolic_sar_kernel(sample, sample, 0.02, 0.2)
+
 
 class TechnicalIndicators:
     """Calculate technical indicators
@@ -355,19 +410,15 @@ class TechnicalIndicators:
             if len(high) < period or len(low) < period or len(close) < period:
                 return 0.0
 
-            # Calculate typical price
-            tp = (high + low + close) / 3
-
-            # Calculate SMA of typical price
-            sma_tp = tp.rolling(period).mean()
+            # Only the last CCI value is returned, so only the last window is needed
+            # (a rolling apply would run a Python lambda for every window)
+            tp = ((high + low + close) / 3).to_numpy(dtype=float)[-period:]
+            sma_tp = tp.mean()
+            mean_dev = np.abs(tp - sma_tp).mean()
 
-            # Calculate mean deviation
-            mean_dev = tp.rolling(period).apply(lambda x: abs(x - x.mean()).mean())
-
-            # Calculate CCI
-            cci = (tp - sma_tp) / (0.015 * mean_dev)
-
-            return float(cci.iloc[-1]) if not cci.empty and not np.isnan(cci.iloc[-1]) else 0.0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cci = (tp[-1] - sma_tp) / (0.015 * mean_dev)
+            return float(cci) if np.isfinite(cci) else 0.0
         except Exception as e:
             logger.error(f"Error calculating CCI: {e}")
             return 0.0
@@ -379,19 +430,14 @@ class TechnicalIndicators:
             if len(close) < 2 or len(volume) < 2:
                 return float(volume.iloc[-1]) if not volume.empty else 0.0
 
-            # Calculate OBV
-            obv = pd.Series(index=close.index, dtype=float)
-            obv.iloc[0] = volume.iloc[0]
+            # OBV = first volume + volume signed by the direction of each close change
+            closes = close.to_numpy(dtype=float)
+            volumes = volume.to_numpy(dtype=float)
+            change = np.diff(closes)
+            direction = np.where(change > 0, 1.0, np.where(change < 0, -1.0, 0.0))
+            obv = volumes[0] + np.sum(direction * volumes[1 : len(closes)])
 
-            for i in range(1, len(close)):
-                if close.iloc[i] > close.iloc[i - 1]:
-                    obv.iloc[i] = obv.iloc[i - 1] + volume.iloc[i]
-                elif close.iloc[i] < close.iloc[i - 1]:
-                    obv.iloc[i] = obv.iloc[i - 1] - volume.iloc[i]
-                else:
-                    obv.iloc[i] = obv.iloc[i - 1]
-
-            return float(obv.iloc[-1]) if not obv.empty and not np.isnan(obv.iloc[-1]) else 0.0
+            return float(obv) if not np.isnan(obv) else 0.0
         except Exception as e:
             logger.error(f"Error calculating OBV: {e}")
             return float(volume.iloc[-1]) if not volume.empty else 0.0
@@ -414,64 +460,15 @@ class TechnicalIndicators:
                     "acceleration_factor": acceleration,
                 }
 
-            # Initialize arrays
-            sar = pd.Series(index=close.index, dtype=float)
-            trend = pd.Series(index=close.index, dtype=str)
-            ep = pd.Series(index=close.index, dtype=float)  # Extreme point
-            af = pd.Series(index=close.index, dtype=float)  # Acceleration factor
-
-            # Initialize first values
-            sar.iloc[0] = low.iloc[0]
-            trend.iloc[0] = "bullish"
-            ep.iloc[0] = high.iloc[0]
-            af.iloc[0] = acceleration
-
-            for i in range(1, len(close)):
-                # Update SAR based on previous trend
-                sar.iloc[i] = sar.iloc[i - 1] + af.iloc[i - 1] * (ep.iloc[i - 1] - sar.iloc[i - 1])
-
-                if trend.iloc[i - 1] == "bullish":
-                    # Update for bullish trend
-                    if low.iloc[i] < sar.iloc[i]:
-                        # Trend reversal
-                        trend.iloc[i] = "bearish"
-                        sar.iloc[i] = ep.iloc[i - 1]
-                        ep.iloc[i] = low.iloc[i]
-                        af.iloc[i] = acceleration
-                    else:
-                        # Continue bullish trend
-                        trend.iloc[i] = "bullish"
-                        if high.iloc[i] > ep.iloc[i - 1]:
-                            ep.iloc[i] = high.iloc[i]
-                            af.iloc[i] = min(af.iloc[i - 1] + acceleration, maximum)
-                        else:
-                            ep.iloc[i] = ep.iloc[i - 1]
-                            af.iloc[i] = af.iloc[i - 1]
-                else:
-                    # Update for bearish trend
-                    if high.iloc[i] > sar.iloc[i]:
-                        # Trend reversal
-                        trend.iloc[i] = "bullish"
-                        sar.iloc[i] = ep.iloc[i - 1]
-                        ep.iloc[i] = high.iloc[i]
-                        af.iloc[i] = acceleration
-                    else:
-                        # Continue bearish trend
-                        trend.iloc[i] = "bearish"
-                        if low.iloc[i] < ep.iloc[i - 1]:
-                            ep.iloc[i] = low.iloc[i]
-                            af.iloc[i] = min(af.iloc[i - 1] + acceleration, maximum)
-                        else:
-                            ep.iloc[i] = ep.iloc[i - 1]
-                            af.iloc[i] = af.iloc[i - 1]
-
-            sar_val = float(sar.iloc[-1]) if not sar.empty and not np.isnan(sar.iloc[-1]) else 0.0
-            trend_val = str(trend.iloc[-1]) if not trend.empty else "bullish"
-            ep_val = float(ep.iloc[-1]) if not ep.empty and not np.isnan(ep.iloc[-1]) else 0.0
-            af_val = (
-                float(af.iloc[-1]) if not af.empty and not np.isnan(af.iloc[-1]) else acceleration
+            sar, bullish, ep, af = _parabolic_sar_kernel(
+                high.to_numpy(dtype=float), low.to_numpy(dtype=float), acceleration, maximum
             )
 
+            sar_val = float(sar) if not np.isnan(sar) else 0.0
+            trend_val = "bullish" if bullish else "bearish"
+            ep_val = float(ep) if not np.isnan(ep) else 0.0
+            af_val = float(af) if not np.isnan(af) else acceleration
+
             return {
                 "value": sar_val,
                 "trend": trend_val,
@@ -2,6 +2,7 @@
 
 import logging
 import os
+import uuid
 from collections.abc import Awaitable
 from typing import Any
 
@@ -15,6 +16,22 @@ from app.exceptions.custom_exceptions import CacheError
 
 logger = logging.getLogger(__name__)
 
+# Compare-and-delete: only the owner of a lock may release it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Compare-and-expire: only the owner of a lock may extend it
+_EXTEND_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
 
 class RedisCacheService:
     """Enhanced service for caching financial data in Redis to improve performance"""
@@ -206,6 +223,146 @@ class RedisCacheService:
             logger.error(f"Error clearing pattern {pattern}: {e}")
             raise CacheError(f"Failed to clear pattern {pattern}: {e!s}")
 
+    async def acquire_lock(self, name: str, ttl: int = 30) -> str | None:
+        """
+        Acquire a cross-process lock with SET NX EX (single-flight)
+
+        Args:
+            name: Lock key
+            ttl: Lock expiry in seconds (released automatically if the owner dies)
+
+        Returns:
+            Lock token if acquired (or Redis is unavailable and the caller runs alone),
+            None if another process owns the lock
+        """
+        token = uuid.uuid4().hex
+        if not await self._ensure_connection() or not self.redis_client:
+            return token
+
+        try:
+            result = self.redis_client.set(name, token, nx=True, ex=ttl)
+            if isinstance(result, Awaitable):
+                result = await result
+            return token if result else None
+        except Exception as e:
+            logger.warning(f"Error acquiring lock {name}: {e}, proceeding without lock")
+            return token
+
+    async def release_lock(self, name: str, token: str) -> bool:
+        """
+        Release a lock acquired with acquire_lock, only if it is still ours
+
+        Args:
+            name: Lock key
+            token: Token returned by acquire_lock
+
+        Returns:
+            True if the lock was released
+        """
+        if not await self._ensure_connection() or not self.redis_client:
+            return False
+
+        try:
+            result = self.redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, name, token)
+            if isinstance(result, Awaitable):
+                result = await result
+            return bool(result)
+        except Exception as e:
+            logger.warning(f"Error releasing lock {name}: {e}")
+            return False
+
+    async def extend_lock(self, name: str, token: str, ttl: int = 30) -> bool:
+        """
+        Extend a lock acquired with acquire_lock, only if it is still ours
+
+        Args:
+            name: Lock key
+            token: Token returned by acquire_lock
+            ttl: New expiry in seconds
+
+        Returns:
+            True if the lock is still owned (always True when Redis is unavailable)
+        """
+        if not await self._ensure_connection() or not self.redis_client:
+            return True
+
+        try:
+            result = self.redis_client.eval(_EXTEND_LOCK_SCRIPT, 1, name, token, ttl)
+            if isinstance(result, Awaitable):
+                result = await result
+            return bool(result)
+        except Exception as e:
+            logger.warning(f"Error extending lock {name}: {e}")
+            return False
+
+    async def get_pattern_values(self, pattern: str) -> list[bytes]:
+        """
+        Get the values of all keys matching a pattern
+
+        Args:
+            pattern: Key pattern (e.g. "prefix:*")
+
+        Returns:
+            Raw values of existing keys (empty when Redis is unavailable)
+        """
+        if not await self._ensure_connection() or not self.redis_client:
+            return []
+
+        try:
+            keys = [key async for key in self.redis_client.scan_iter(match=pattern)]
+            if not keys:
+                return []
+            values = await self.redis_client.mget(keys)
+            return [value for value in values if value is not None]
+        except Exception as e:
+            logger.warning(f"Error reading keys {pattern}: {e}")
+            return []
+
+    async def publish(self, channel: str, message: bytes) -> int:
+        """
+        Publish a message on a pub/sub channel
+
+        Args:
+            channel: Channel name
+            message: Serialized message
+
+        Returns:
+            Number of subscribers that received it (0 when Redis is unavailable)
+        """
+        if not await self._ensure_connection() or not self.redis_client:
+            return 0
+
+        try:
+            result = self.redis_client.publish(channel, message)
+            if isinstance(result, Awaitable):
+                result = await result
+            return int(result)
+        except Exception as e:
+            logger.warning(f"Error publishing to {channel}: {e}")
+            return 0
+
+    async def subscribe(self, channel: str) -> Any | None:
+        """
+        Subscribe to a pub/sub channel
+
+        Args:
+            channel: Channel name
+
+        Returns:
+            PubSub object (read with get_message, close with aclose), or None when Redis
+            is unavailable
+        """
+        if not await self._ensure_connection() or not self.redis_client:
+            return None
+
+        try:
+            pubsub = self.redis_client.pubsub()
+            await pubsub.subscribe(channel)
+            return pubsub
+        except Exception as e:
+            logger.warning(f"Error subscribing to {channel}: {e}")
+            return None
+
     async def get_stats(self) -> dict[str, Any]:
         """
         Get Redis cache statistics
@@ -0,0 +1,1495 @@
+let ws = null;
+let currentAssets = [];
+let userWatchlist = new Set();
+let activeTab = 'all';
+let selectedAsset = null;
+let currentTimeframe = '5m';
+let currentHistoricalPeriod = '1mo';
+let autoRefreshEnabled = true;
+let refreshInterval = null;
+let selectedCompareAssets = new Set();
+let comparePeriod = '1mo';
+let messageChain = Promise.resolve();
+
+// Elements touched on every message / reconnect, looked up once
+// (the script is loaded at the end of <body>, so they already exist)
+const dom = {
+    status: document.getElementById('status'),
+    lastUpdate: document.getElementById('lastUpdate'),
+    dashboard: document.getElementById('dashboard'),
+    cardTemplate: document.getElementById('cardTpl'),
+    notification: document.getElementById('notification'),
+    userStatus: document.getElementById('userStatus'),
+    username: document.getElementById('username'),
+    loginBtn: document.getElementById('loginBtn'),
+    logoutBtn: document.getElementById('logoutBtn'),
+};
+
+// Reconnect: capped exponential backoff with jitter, reset on a successful open
+const RECONNECT_BASE_DELAY = 1000;
+const RECONNECT_MAX_DELAY = 60000;
+let reconnectBackoff = RECONNECT_BASE_DELAY;
+let reconnectTimer = null;
+
+function scheduleReconnect() {
+    if (reconnectTimer !== null) return;
+
+    // Background tabs reconnect lazily when they become visible again
+    if (document.visibilityState === 'hidden') {
+        document.addEventListener('visibilitychange', reconnectWhenVisible);
+        return;
+    }
+
+    const delay = Math.min(RECONNECT_MAX_DELAY, reconnectBackoff) * (0.5 + Math.random());
+    reconnectBackoff = Math.min(RECONNECT_MAX_DELAY, reconnectBackoff * 2);
+    reconnectTimer = setTimeout(() => {
+        reconnectTimer = null;
+        connect();
+    }, delay);
+}
+
+function reconnectWhenVisible() {
+    if (document.visibilityState !== 'visible') return;
+    document.removeEventListener('visibilitychange', reconnectWhenVisible);
+    scheduleReconnect();
+}
+
+// Minimal IndexedDB key-value cache: the last asset state and historical series are
+// kept between page loads so the grid renders before the WebSocket handshake completes
+const CACHE_DB_NAME = 'finance-monitor';
+const CACHE_STORE = 'kv';
+const ASSETS_CACHE_TTL = 60 * 60 * 1000;  // 1 hour
+const HISTORY_CACHE_TTL = 15 * 60 * 1000;  // 15 minutes
+const ASSETS_PERSIST_DELAY = 5000;
+let cacheDbPromise = null;
+let assetsPersistTimer = null;
+
+function openCacheDb() {
+    if (!window.indexedDB) {
+        return Promise.reject(new Error('IndexedDB is not available'));
+    }
+    if (!cacheDbPromise) {
+        cacheDbPromise = new Promise((resolve, reject) => {
+            const request = indexedDB.open(CACHE_DB_NAME, 1);
+            request.onupgradeneeded = () => request.result.createObjectStore(CACHE_STORE);
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => reject(request.error);
+        });
+    }
+    return cacheDbPromise;
+}
+
+function cacheRequest(mode, operation) {
+    return openCacheDb().then(db => new Promise((resolve, reject) => {
+        const request = operation(db.transaction(CACHE_STORE, mode).objectStore(CACHE_STORE));
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    }));
+}
+
+function cacheGet(key, ttl) {
+    // Resolves to undefined when missing, expired or when IndexedDB is unavailable
+    return cacheRequest('readonly', store => store.get(key))
+        .then(entry => (entry && Date.now() - entry.ts < ttl ? entry.data : undefined))
+        .catch(() => undefined);
+}
+
+function cacheSet(key, data) {
+    return cacheRequest('readwrite', store => store.put({data, ts: Date.now()}, key))
+        .catch(error => console.warn('Cache write failed:', error));
+}
+
+function scheduleAssetsPersist() {
+    // Ticks arrive every few seconds; write the merged state at most once per delay
+    if (assetsPersistTimer !== null) return;
+    assetsPersistTimer = setTimeout(() => {
+        assetsPersistTimer = null;
+        cacheSet('lastAssets', currentAssets);
+    }, ASSETS_PERSIST_DELAY);
+}
+
+function hydrateFromCache() {
+    return cacheGet('lastAssets', ASSETS_CACHE_TTL).then(assets => {
+        // Live data wins if it arrived first
+        if (assets && assetsBySymbol.size === 0) {
+            mergeAssets(assets);
+            updateDashboard();
+        }
+    });
+}
+
+// Constant control messages, serialized once
+const REFRESH_MSG = JSON.stringify({action: 'refresh'});
+const PAUSE_MSG = JSON.stringify({action: 'pause'});
+const RESUME_MSG = JSON.stringify({action: 'resume'});
+const timeframeMessages = new Map();
+
+function timeframeMessage(timeframe) {
+    if (!timeframeMessages.has(timeframe)) {
+        timeframeMessages.set(timeframe, JSON.stringify({action: 'set_timeframe', timeframe}));
+    }
+    return timeframeMessages.get(timeframe);
+}
+
+// Hidden tabs ask the server to stop streaming; on return it sends a fresh snapshot.
+// (Rendering is already deferred: requestAnimationFrame does not run in hidden tabs.)
+function syncStreamWithVisibility() {
+    if (ws && ws.readyState === WebSocket.OPEN) {
+        ws.send(document.hidden ? PAUSE_MSG : RESUME_MSG);
+    }
+}
+
+function connect() {
+    const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+    // The httpOnly session cookie set by /api/users/login authenticates the socket
+    const wsUrl = `${protocol}//${window.location.host}/ws`;
+    // Offer binary MessagePack / deflated JSON frames when the browser can decode them;
+    // the server falls back to plain JSON text otherwise
+    const subprotocols = [];
+    if (window.MessagePack) subprotocols.push('msgpack');
+    if (window.DecompressionStream) subprotocols.push('json.deflate');
+    subprotocols.push('json');
+    ws = new WebSocket(wsUrl, subprotocols);
+    ws.binaryType = 'arraybuffer';
+
+    ws.onopen = () => {
+        reconnectBackoff = RECONNECT_BASE_DELAY;
+        dom.status.textContent = '🟢 Connected';
+        dom.status.className = 'status connected';
+        showNotification('Connected to real-time data stream');
+
+        // Request data with current timeframe
+        if (ws.readyState === WebSocket.OPEN) {
+            ws.send(timeframeMessage(currentTimeframe));
+            if (document.hidden) {
+                ws.send(PAUSE_MSG);
+            }
+        }
+    };
+
+    ws.onclose = (event) => {
+        dom.status.textContent = '🔴 Disconnected';
+        dom.status.className = 'status disconnected';
+
+        // Show notification only if it wasn't a clean disconnect
+        if (event.code !== 1000) {
+            showNotification('Connection lost. Reconnecting...', 'error');
+        }
+
+        scheduleReconnect();
+    };
+
+    ws.onerror = (error) => {
+        console.error('WebSocket error:', error);
+        showNotification('Connection error. Reconnecting...', 'error');
+    };
+
+    ws.onmessage = (event) => {
+        // Decode in arrival order; deflated frames are inflated asynchronously
+        messageChain = messageChain
+            .then(() => decodeMessage(event.data, event.target.protocol))
+            .then(handleMessage)
+            .catch((e) => {
+                console.error('Error parsing message:', e);
+                showNotification('Error parsing data', 'error');
+            });
+    };
+}
+
+async function decodeMessage(data, protocol) {
+    if (typeof data === 'string') {
+        return JSON.parse(data);
+    }
+    if (protocol === 'json.deflate') {
+        const stream = new Blob([data]).stream().pipeThrough(new DecompressionStream('deflate'));
+        return JSON.parse(await new Response(stream).text());
+    }
+    return MessagePack.decode(new Uint8Array(data));
+}
+
+// Authentication functions
+function showLoginModal() {
+    document.getElementById('loginModal').style.display = 'flex';
+    document.getElementById('loginUsername').focus();
+}
+
+function closeLoginModal() {
+    document.getElementById('loginModal').style.display = 'none';
+    document.getElementById('loginUsername').value = '';
+    document.getElementById('loginPassword').value = '';
+}
+
+async function login() {
+    const username = document.getElementById('loginUsername').value.trim();
+    const password = document.getElementById('loginPassword').value;
+
+    if (!username || !password) {
+        showNotification('Please fill in all fields', 'error');
+        return;
+    }
+
+    try {
+        // URLSearchParams encodes the fields and sets the form Content-Type itself;
+        // keepalive lets the request finish even if the page navigates away
+        const response = await fetch('/api/users/login', {
+            method: 'POST',
+            body: new URLSearchParams({username, password}),
+            credentials: 'same-origin',
+            keepalive: true
+        });
+
+        if (!response.ok) {
+            let errorMessage = 'Login failed';
+            try {
+                const errorData = await response.json();
+                errorMessage = errorData.detail || errorMessage;
+            } catch (e) {
+                // If we can't parse the error response, use the status text
+                errorMessage = response.statusText || errorMessage;
+            }
+            throw new Error(errorMessage);
+        }
+
+        const data = await response.json();
+
+        // Update UI
+        dom.username.textContent = data.username;
+        dom.userStatus.style.display = 'inline-block';
+        dom.loginBtn.style.display = 'none';
+        dom.logoutBtn.style.display = 'inline-block';
+
+        closeLoginModal();
+        showNotification(`Welcome, ${data.username}!`);
+
+        // The token itself lives in an httpOnly cookie, out of reach of page scripts
+        localStorage.setItem('username', data.username);
+        reconnectWithSession();
+    } catch (error) {
+        console.error('Login error:', error);
+        showNotification(error.message || 'Login failed', 'error');
+    }
+}
+
+function reconnectWithSession() {
+    // Clean close: onclose reconnects and the new socket carries the current cookie
+    if (ws && ws.readyState === WebSocket.OPEN) ws.close(1000);
+}
+
+async function logout() {
+    try {
+        await fetch('/api/users/session', {method: 'DELETE'});
+    } catch (error) {
+        console.error('Logout error:', error);
+    }
+
+    // Update UI
+    dom.userStatus.style.display = 'none';
+    dom.loginBtn.style.display = 'inline-block';
+    dom.logoutBtn.style.display = 'none';
+
+    localStorage.removeItem('username');
+
+    showNotification('You have been logged out');
+    reconnectWithSession();
+}
+
+function checkAuthStatus() {
+    // Check if user is already logged in (the session itself is an httpOnly cookie)
+    localStorage.removeItem('authToken');  // left over from token-in-localStorage versions
+    const username = localStorage.getItem('username');
+
+    if (username) {
+        dom.username.textContent = username;
+        dom.userStatus.style.display = 'inline-block';
+        dom.loginBtn.style.display = 'none';
+        dom.logoutBtn.style.display = 'inline-block';
+    } else {
+        dom.loginBtn.style.display = 'inline-block';
+    }
+}
+
+function showRegisterForm() {
+    closeLoginModal();
+    document.getElementById('registerModal').style.display = 'flex';
+    document.getElementById('registerUsername').focus();
+}
+
+function showLoginForm() {
+    closeRegisterModal();
+    showLoginModal();
+}
+
+function closeRegisterModal() {
+    document.getElementById('registerModal').style.display = 'none';
+    document.getElementById('registerUsername').value = '';
+    document.getElementById('registerEmail').value = '';
+    document.getElementById('registerPassword').value = '';
+    document.getElementById('registerConfirmPassword').value = '';
+}
+
+const EMAIL_RE = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+
+// Password strength in a single pass: at least 8 characters with an uppercase letter,
+// a lowercase letter, a digit and a special character (the server re-validates)
+function checkPassword(p) {
+    if (p.length < 8) return false;
+    let upper = 0, lower = 0, digit = 0, special = 0;
+    for (let i = 0; i < p.length; i++) {
+        const c = p.charCodeAt(i);
+        if (c >= 65 && c <= 90) upper = 1;
+        else if (c >= 97 && c <= 122) lower = 1;
+        else if (c >= 48 && c <= 57) digit = 1;
+        else special = 1;
+        if (upper & lower & digit & special) return true;
+    }
+    return false;
+}
+
+async function register() {
+    const username = document.getElementById('registerUsername').value.trim();
+    const email = document.getElementById('registerEmail').value.trim();
+    const password = document.getElementById('registerPassword').value;
+    const confirmPassword = document.getElementById('registerConfirmPassword').value;
+
+    // Basic validation
+    if (!username || !email || !password || !confirmPassword) {
+        showNotification('Please fill in all fields', 'error');
+        return;
+    }
+
+    if (password !== confirmPassword) {
+        showNotification('Passwords do not match', 'error');
+        return;
+    }
+
+    if (password.length < 8) {
+        showNotification('Password must be at least 8 characters long', 'error');
+        return;
+    }
+
+    if (!checkPassword(password)) {
+        showNotification('Password must contain uppercase and lowercase letters, a digit and a special character', 'error');
+        return;
+    }
+
+    // Email validation
+    if (!EMAIL_RE.test(email)) {
+        showNotification('Please enter a valid email address', 'error');
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/users/register', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                username: username,
+                email: email,
+                password: password
+            })
+        });
+
+        if (!response.ok) {
+            let errorMessage = 'Registration failed';
+            try {
+                const errorData = await response.json();
+                errorMessage = errorData.detail || errorMessage;
+            } catch (e) {
+                // If we can't parse the error response, use the status text
+                errorMessage = response.statusText || errorMessage;
+            }
+            throw new Error(errorMessage);
+        }
+
+        const data = await response.json();
+
+        closeRegisterModal();
+        showNotification(`Registration successful! Welcome, ${data.username}! Please login.`);
+
+        // Show login form after successful registration
+        setTimeout(showLoginModal, 2000);
+    } catch (error) {
+        console.error('Registration error:', error);
+        showNotification(error.message || 'Registration failed', 'error');
+    }
+}
+
+function handleMessage(message) {
+    try {
+        if (message.type === 'update' || message.type === 'snapshot') {
+            // Snapshots (on connect / refresh) carry the full state; ticks only changed assets
+            if (message.type === 'snapshot') {
+                clearAssets();
+            }
+            const regrouped = mergeAssets(message.data);
+            if (message.type === 'snapshot' || regrouped) {
+                updateDashboard();
+            } else {
+                // Ticks for known symbols: patch just their cards (also keeps search results)
+                updateChangedAssets(message.data);
+            }
+            scheduleAssetsPersist();
+            dom.lastUpdate.textContent = timeFormat.format(new Date(message.timestamp));
+        } else if (message.type === 'batch') {
+            // Server coalesced queued frames; every delta must be merged in order,
+            // rendering is still done once per animation frame
+            message.items.forEach(handleMessage);
+        } else if (message.type === 'init') {
+            // Initialize user watchlist
+            if (message.watchlist) {
+                userWatchlist = new Set(message.watchlist);
+            }
+        } else if (message.type === 'notification') {
+            showNotification(message.message);
+        } else if (message.type === 'error') {
+            showNotification(message.message, 'error');
+        } else if (message.type === 'watchlist') {
+            if (message.data) {
+                userWatchlist = new Set(message.data);
+                if (activeTab === 'watchlist') {
+                    updateDashboard();
+                }
+            }
+        } else {
+            console.warn('Unknown message type received:', message.type);
+        }
+    } catch (error) {
+        console.error('Error handling WebSocket message:', error);
+        showNotification('Error processing data', 'error');
+    }
+}
+
+// Period/timeframe buttons: only the last selection within this window is sent
+const SELECTION_DEBOUNCE_DELAY = 200;
+
+function debounce(fn, delay) {
+    let timer = null;
+    return (...args) => {
+        clearTimeout(timer);
+        timer = setTimeout(() => fn(...args), delay);
+    };
+}
+
+const sendTimeframe = debounce(() => {
+    if (ws && ws.readyState === WebSocket.OPEN) {
+        ws.send(timeframeMessage(currentTimeframe));
+        showNotification(`Timeframe changed to ${currentTimeframe}`);
+    }
+}, SELECTION_DEBOUNCE_DELAY);
+
+const fetchSelectedHistoricalData = debounce(() => {
+    if (selectedAsset) {
+        fetchHistoricalData(selectedAsset, currentHistoricalPeriod);
+    }
+}, SELECTION_DEBOUNCE_DELAY);
+
+// Search as you type: a burst of keystrokes filters and renders once, SEARCH_DEBOUNCE_DELAY
+// after the last one (short enough to still feel immediate; Enter searches right away)
+const SEARCH_DEBOUNCE_DELAY = 150;
+const searchAssetsDebounced = debounce(() => searchAssets(), SEARCH_DEBOUNCE_DELAY);
+
+const reloadComparisonData = debounce(() => {
+    if (selectedCompareAssets.size > 0) {
+        loadComparisonData();
+    }
+}, SELECTION_DEBOUNCE_DELAY);
+
+// Move "active" from the group's current item (tab bar / button row) to the clicked one
+// without re-querying and touching every sibling
+function activateInGroup(element) {
+    element.parentElement.querySelector(':scope > .active')?.classList.remove('active');
+    element.classList.add('active');
+}
+
+function updateTimeframe(interval, button) {
+    currentTimeframe = interval;
+
+    // Update active button
+    activateInGroup(button);
+
+    // Request new data with selected timeframe
+    sendTimeframe();
+}
+
+function updateHistoricalPeriod(period, button) {
+    currentHistoricalPeriod = period;
+
+    // Update active button
+    activateInGroup(button);
+
+    // Fetch historical data for selected asset
+    fetchSelectedHistoricalData();
+}
+
+function updateComparePeriod(period, button) {
+    comparePeriod = period;
+
+    // Update active button
+    activateInGroup(button);
+
+    // Update comparison chart if assets are selected
+    reloadComparisonData();
+}
+
+function fetchHistoricalData(symbol, period) {
+    // Fetch historical data from API
+    showNotification(`Fetching historical data for ${symbol} (${period})`);
+
+    // Convert period to days
+    const periodToDays = {
+        '1D': 1,
+        '5D': 5,
+        '1M': 30,
+        '3M': 90,
+        '6M': 180,
+        '1Y': 365,
+        '5Y': 365 * 5
+    };
+
+    const days = periodToDays[period] || 30;
+    const points = historicalPointCount(symbol);
+    const cacheKey = `hist:${symbol}:${days}:${points}`;
+
+    cacheGet(cacheKey, HISTORY_CACHE_TTL).then(cached => {
+        if (cached) {
+            updateChartWithHistoricalData(symbol, cached);
+            return;
+        }
+        loadHistoricalData(symbol, days, points, cacheKey);
+    });
+}
+
+// One point per pixel of the card chart is all Plotly can show; the server downsamples to it
+const DEFAULT_CHART_POINTS = 200;
+
+function historicalPointCount(symbol) {
+    const entry = cardIndex.get(symbol);
+    const width = entry ? entry.chartEl.clientWidth : 0;
+    return width ? Math.min(Math.max(Math.round(width), 10), 2000) : DEFAULT_CHART_POINTS;
+}
+
+function loadHistoricalData(symbol, days, points, cacheKey) {
+    fetch(`/api/asset/${symbol}/historical?period=${days}&points=${points}`)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error('Failed to fetch historical data');
+            }
+            return response.json();
+        })
+        .then(data => {
+            if (data.data && data.data.length > 0) {
+                showNotification(`Historical data loaded for ${symbol} (${data.data.length} points)`);
+                cacheSet(cacheKey, data.data);
+                // Update chart with historical data
+                updateChartWithHistoricalData(symbol, data.data);
+            } else {
+                showNotification(`No historical data available for ${symbol}`, 'error');
+            }
+        })
+        .catch(error => {
+            console.error('Error fetching historical data:', error);
+            showNotification(`Error loading historical data: ${error.message}`, 'error');
+        });
+}
+
+function updateChartWithHistoricalData(symbol, points) {
+    const entry = cardIndex.get(symbol);
+    if (!entry) return;
+    // Same lazy path as stream data: drawn now if the card is on screen, else on scroll-in
+    entry.chartData = points;
+    entry.chartDrawn = false;
+    if (!chartObserver || entry.onScreen) drawCardChart(entry);
+}
+
+const AUTO_REFRESH_INTERVAL = 30000; // 30 seconds
+
+// Exactly one auto-refresh timer exists while enabled (start is idempotent)
+function startAutoRefresh() {
+    autoRefreshEnabled = true;
+    if (refreshInterval) return;
+    refreshInterval = setInterval(() => {
+        if (!document.hidden && ws && ws.readyState === WebSocket.OPEN) {
+            ws.send(REFRESH_MSG);
+        }
+    }, AUTO_REFRESH_INTERVAL);
+}
+
+function stopAutoRefresh() {
+    autoRefreshEnabled = false;
+    if (refreshInterval) {
+        clearInterval(refreshInterval);
+        refreshInterval = null;
+    }
+}
+
+function syncAutoRefreshButton(button) {
+    button.innerHTML = autoRefreshEnabled
+        ? '<i class="fas fa-pause"></i> Pause'
+        : '<i class="fas fa-play"></i> Auto Refresh';
+    button.classList.toggle('btn-warning', autoRefreshEnabled);
+    button.classList.toggle('btn-info', !autoRefreshEnabled);
+}
+
+function toggleAutoRefresh(button) {
+    if (autoRefreshEnabled) {
+        stopAutoRefresh();
+    } else {
+        startAutoRefresh();
+    }
+    syncAutoRefreshButton(button);
+}
+
+// Pending dashboard patch; the visible set is derived from the latest state at frame time
+let pendingDashboardFrame = null;
+let pendingFullRender = false;
+const pendingChangedAssets = new Map();  // symbol -> latest asset, patched without a full render
+
+// Manual refresh throttle and the pending notification hide timer
+const REFRESH_THROTTLE_MS = 1000;
+let lastManualRefresh = -Infinity;
+let notificationTimer = null;
+
+// Latest data per symbol (updates carry only changed assets) and the card shown for each
+const assetsBySymbol = new Map();
+const cardIndex = new Map();
+
+// Formatters are expensive to create; build them once
+const priceFormat = new Intl.NumberFormat('en-US', {minimumFractionDigits: 2, maximumFractionDigits: 2});
+// Sub-dollar quotes (e.g. small-cap crypto) need more precision than cents
+const lowPriceFormat = new Intl.NumberFormat('en-US', {minimumFractionDigits: 6, maximumFractionDigits: 6});
+const volumeFormat = new Intl.NumberFormat();
+const timeFormat = new Intl.DateTimeFormat(undefined, {hour: '2-digit', minute: '2-digit', second: '2-digit'});
+const dateTimeFormat = new Intl.DateTimeFormat(undefined, {dateStyle: 'short', timeStyle: 'medium'});
+
+// Indexes kept in step with assetsBySymbol so tab filters and search do not
+// re-derive them from every asset on each tick / keystroke
+const symbolsByType = new Map();  // asset type -> Set of symbols
+const searchKeys = new Map();  // symbol -> lower-cased "symbol\nname"
+const TAB_TYPES = {stocks: 'stock', crypto: 'crypto', commodities: 'commodity', forex: 'forex'};
+
+// One predicate per filtering tab, built once ("all" and "portfolio" show everything)
+const TAB_FILTERS = {
+    stocks: asset => asset.type === 'stock',
+    crypto: asset => asset.type === 'crypto',
+    commodities: asset => asset.type === 'commodity',
+    forex: asset => asset.type === 'forex',
+    watchlist: asset => userWatchlist.has(asset.symbol),
+};
+
+// Returns true when the asset is new or changed type (the displayed set may change)
+function indexAsset(asset) {
+    const previous = assetsBySymbol.get(asset.symbol);
+    const regrouped = !previous || previous.type !== asset.type;
+    if (previous && previous.type !== asset.type) {
+        symbolsByType.get(previous.type)?.delete(asset.symbol);
+    }
+    if (!symbolsByType.has(asset.type)) symbolsByType.set(asset.type, new Set());
+    symbolsByType.get(asset.type).add(asset.symbol);
+    if (!previous || previous.name !== asset.name) {
+        searchKeys.set(asset.symbol, `${asset.symbol}\n${asset.name}`.toLowerCase());
+    }
+    return regrouped;
+}
+
+// Merge assets into the store; true if any symbol is new or changed type
+function mergeAssets(assets) {
+    let regrouped = false;
+    assets.forEach(asset => {
+        if (indexAsset(asset)) regrouped = true;
+        assetsBySymbol.set(asset.symbol, asset);
+    });
+    currentAssets = Array.from(assetsBySymbol.values());
+    return regrouped;
+}
+
+function clearAssets() {
+    assetsBySymbol.clear();
+    symbolsByType.clear();
+    searchKeys.clear();
+}
+
+function createCard(asset) {
+    const card = dom.cardTemplate.content.firstElementChild.cloneNode(true);
+    const field = name => card.querySelector(`[data-field="${name}"]`);
+
+    field('icon').textContent = asset.symbol.charAt(0);
+    field('name').textContent = asset.name;
+    field('symbol').textContent = asset.symbol;
+    field('type').textContent = asset.type;
+
+    card.dataset.symbol = asset.symbol;  // card button actions look the asset up by symbol
+    const chartEl = card.querySelector('.chart');
+    chartEl.id = `chart-${asset.symbol}`;
+
+    const fields = {};
+    ['price', 'change', 'changeIcon', 'changePercent', 'open', 'high', 'low', 'volume']
+        .forEach(name => { fields[name] = field(name); });
+    chartObserver?.observe(card);
+    return {
+        card, fields, chartEl, text: {}, values: {},
+        isUp: null, chartData: null, onScreen: false, chartDrawn: false
+    };
+}
+
+// Charts are drawn only for cards near the viewport and purged once they scroll away,
+// so the number of live Plotly instances is bounded by the screen, not the asset count
+const chartObserver = 'IntersectionObserver' in window
+    ? new IntersectionObserver(onCardVisibility, {rootMargin: '200px 0px'})
+    : null;
+
+function onCardVisibility(observed) {
+    observed.forEach(({target, isIntersecting}) => {
+        const entry = cardIndex.get(target.dataset.symbol);
+        if (!entry) return;
+        entry.onScreen = isIntersecting;
+        if (isIntersecting) {
+            drawCardChart(entry);
+        } else {
+            purgeCardChart(entry);
+        }
+    });
+}
+
+// Chart draws requested while cards are being written are queued and run together on the
+// next frame: all containers are measured first (one layout), then every chart is drawn
+// with explicit dimensions so Plotly does not measure (and force layout) per chart
+const pendingChartDraws = new Set();
+let chartDrawFrame = null;
+
+function drawCardChart(entry) {
+    if (entry.chartDrawn || !entry.chartData) return;
+    entry.chartDrawn = true;
+    pendingChartDraws.add(entry);
+    if (chartDrawFrame === null) {
+        chartDrawFrame = requestAnimationFrame(flushChartDraws);
+    }
+}
+
+function flushChartDraws() {
+    chartDrawFrame = null;
+    const entries = Array.from(pendingChartDraws);
+    pendingChartDraws.clear();
+
+    // Read phase: geometry is measured fresh every frame, never cached across frames
+    const sizes = entries.map(entry => ({
+        width: entry.chartEl.clientWidth,
+        height: entry.chartEl.clientHeight
+    }));
+
+    // Write phase
+    entries.forEach((entry, i) => {
+        renderChart(entry.card.dataset.symbol, entry.chartData, sizes[i]);
+    });
+}
+
+function purgeCardChart(entry) {
+    pendingChartDraws.delete(entry);
+    if (!entry.chartDrawn) return;
+    entry.chartDrawn = false;
+    plottedSeries.delete(entry.chartEl);
+    if (window.Plotly) window.Plotly.purge(entry.chartEl);
+}
+
+function releaseCard(entry) {
+    chartObserver?.unobserve(entry.card);
+    purgeCardChart(entry);
+    entry.card.remove();
+}
+
+function setCardValue(entry, name, value, format) {
+    // Most fields keep their value between ticks: skip formatting them again
+    if (entry.values[name] !== value) {
+        entry.values[name] = value;
+        setCardText(entry, name, format(value));
+    }
+}
+
+const formatPrice = value => `$${(Math.abs(value) < 1 ? lowPriceFormat : priceFormat).format(value)}`;
+const formatPercent = value => `${priceFormat.format(Math.abs(value))}%`;
+const formatVolume = value => value != null ? volumeFormat.format(value) : 'N/A';
+
+function setCardText(entry, name, text) {
+    // Touch the DOM only when the rendered text actually changes
+    if (entry.text[name] !== text) {
+        entry.text[name] = text;
+        entry.fields[name].textContent = text;
+    }
+}
+
+function patchCard(entry, asset) {
+    const isUp = asset.change_percent >= 0;
+    if (entry.isUp !== isUp) {
+        entry.isUp = isUp;
+        entry.fields.change.classList.toggle('positive', isUp);
+        entry.fields.change.classList.toggle('negative', !isUp);
+        setCardText(entry, 'changeIcon', isUp ? '▲' : '▼');
+    }
+    setCardValue(entry, 'price', asset.current_price, formatPrice);
+    setCardValue(entry, 'changePercent', asset.change_percent, formatPercent);
+    setCardValue(entry, 'open', asset.open, formatPrice);
+    setCardValue(entry, 'high', asset.high, formatPrice);
+    setCardValue(entry, 'low', asset.low, formatPrice);
+    setCardValue(entry, 'volume', asset.volume, formatVolume);
+}
+
+function patchDashboard(assets) {
+    const dashboard = dom.dashboard;
+
+    if (assets.length === 0) {
+        cardIndex.forEach(releaseCard);
+        cardIndex.clear();
+        const empty = document.createElement('div');
+        empty.className = 'empty-state';
+        empty.innerHTML = `
+            <i class="fas fa-info-circle"></i>
+            <h3>No assets found</h3>
+            <p>Try adding assets to your watchlist or changing filters</p>
+        `;
+        dashboard.replaceChildren(empty);
+        return;
+    }
+
+    // Drop cards that are no longer shown
+    const visible = new Set(assets.map(asset => asset.symbol));
+    for (const [symbol, entry] of cardIndex) {
+        if (!visible.has(symbol)) {
+            releaseCard(entry);
+            cardIndex.delete(symbol);
+        }
+    }
+    if (cardIndex.size === 0) {
+        // Clear the loading / empty state
+        dashboard.replaceChildren();
+    }
+
+    // Existing cards are patched in place; a card is (re)inserted only when it is new or
+    // out of order (e.g. after a tab switch), so steady-state ticks move no nodes
+    const chartsToDraw = [];
+    let cursor = dashboard.firstElementChild;
+    assets.forEach(asset => {
+        let entry = cardIndex.get(asset.symbol);
+        if (!entry) {
+            entry = createCard(asset);
+            cardIndex.set(asset.symbol, entry);
+        }
+        if (entry.card === cursor) {
+            cursor = cursor.nextElementSibling;
+        } else {
+            dashboard.insertBefore(entry.card, cursor);
+        }
+        patchEntry(entry, asset, chartsToDraw);
+    });
+
+    // Charts need their containers in the document
+    chartsToDraw.forEach(drawCardChart);
+}
+
+function patchEntry(entry, asset, chartsToDraw) {
+    patchCard(entry, asset);
+    if (entry.chartData !== asset.chart_data) {
+        entry.chartData = asset.chart_data;
+        entry.chartDrawn = false;
+        // Off-screen (and new, not yet observed) cards draw when they scroll into view
+        if (!chartObserver || entry.onScreen) chartsToDraw.push(entry);
+    }
+}
+
+function updateDashboard() {
+    // Coalesce every call within one frame (~16 ms) into a single render of the latest
+    // assets; filtering and DOM patching run once per frame, not once per tick
+    pendingFullRender = true;
+    scheduleDashboardFrame();
+}
+
+function updateChangedAssets(assets) {
+    // Only these symbols changed and each already has its place: no filtering or reordering
+    assets.forEach(asset => pendingChangedAssets.set(asset.symbol, asset));
+    scheduleDashboardFrame();
+}
+
+function scheduleDashboardFrame() {
+    if (pendingDashboardFrame !== null) return;
+    pendingDashboardFrame = requestAnimationFrame(renderDashboardFrame);
+}
+
+function renderDashboardFrame() {
+    pendingDashboardFrame = null;
+    if (pendingFullRender) {
+        // Re-read the store now: ticks merged after updateDashboard() are included
+        pendingFullRender = false;
+        patchDashboard(visibleAssets());
+    }
+
+    // Patched cards skip unchanged values, so changes already rendered above cost nothing
+    const chartsToDraw = [];
+    pendingChangedAssets.forEach((asset, symbol) => {
+        const entry = cardIndex.get(symbol);
+        if (entry) patchEntry(entry, asset, chartsToDraw);  // no card: filtered out
+    });
+    pendingChangedAssets.clear();
+    chartsToDraw.forEach(drawCardChart);
+}
+
+function filterForActiveTab(assets) {
+    const type = TAB_TYPES[activeTab];
+    if (type && assets === currentAssets) {
+        // Full asset list: read the type index instead of scanning
+        const symbols = symbolsByType.get(type);
+        return symbols ? Array.from(symbols, symbol => assetsBySymbol.get(symbol)) : [];
+    }
+    const predicate = TAB_FILTERS[activeTab];
+    return predicate ? assets.filter(predicate) : assets;
+}
+
+// Assets shown for the current search query (empty: all) and active tab
+function visibleAssets() {
+    const query = document.getElementById('symbolInput').value.trim().toLowerCase();
+    if (!query) return filterForActiveTab(currentAssets);
+    return filterForActiveTab(currentAssets.filter(asset =>
+        searchKeys.get(asset.symbol).includes(query)
+    ));
+}
+
+function searchAssets() {
+    // The query is read when the frame renders
+    updateDashboard();
+}
+
+function showCreateAlertModal(symbol) {
+    document.getElementById('alertSymbol').value = symbol;
+    document.getElementById('createAlertModal').style.display = 'flex';
+    document.getElementById('alertPrice').focus();
+}
+
+function refreshData() {
+    // Repeated clicks within REFRESH_THROTTLE_MS reuse the snapshot already requested
+    const now = performance.now();
+    if (now - lastManualRefresh < REFRESH_THROTTLE_MS) return;
+
+    if (ws && ws.readyState === WebSocket.OPEN) {
+        lastManualRefresh = now;
+        ws.send(REFRESH_MSG);
+        showNotification('Refreshing data...');
+    }
+}
+
+function showAddAssetModal() {
+    document.getElementById('addAssetModal').style.display = 'flex';
+    document.getElementById('newAssetSymbol').focus();
+}
+
+function closeAddAssetModal() {
+    document.getElementById('addAssetModal').style.display = 'none';
+    document.getElementById('newAssetSymbol').value = '';
+}
+
+function addToWatchlist(symbol) {
+    if (!symbol || !ws || ws.readyState !== WebSocket.OPEN) return false;
+
+    ws.send(JSON.stringify({
+        action: 'add_asset',
+        symbol: symbol
+    }));
+    showNotification(`Added ${symbol} to watchlist`);
+    return true;
+}
+
+function addAssetToWatchlist() {
+    const symbol = document.getElementById('newAssetSymbol').value.trim().toUpperCase();
+
+    if (addToWatchlist(symbol)) {
+        closeAddAssetModal();
+    }
+}
+
+function showExportModal(symbol) {
+    document.getElementById('exportSymbol').textContent = symbol;
+    document.getElementById('exportModal').style.display = 'flex';
+}
+
+function closeExportModal() {
+    document.getElementById('exportModal').style.display = 'none';
+}
+
+function exportData(format) {
+    const symbol = document.getElementById('exportSymbol').textContent;
+    showNotification(`Exporting ${symbol} data as ${format.toUpperCase()}...`);
+    closeExportModal();
+    // In a real implementation, this would trigger an actual export
+}
+
+function showCompareModal() {
+    document.getElementById('compareModal').style.display = 'flex';
+    // Load available assets for comparison
+    loadCompareAssets();
+}
+
+function closeCompareModal() {
+    document.getElementById('compareModal').style.display = 'none';
+}
+
+function loadCompareAssets() {
+    // In a real implementation, this would load available assets
+    // For now, we'll use a mock list
+    const assetsList = document.getElementById('compareAssetsList');
+
+    // Mock assets for demonstration
+    const mockAssets = [
+        {symbol: 'AAPL', name: 'Apple Inc.'},
+        {symbol: 'GOOGL', name: 'Alphabet Inc.'},
+        {symbol: 'MSFT', name: 'Microsoft Corp.'},
+        {symbol: 'bitcoin', name: 'Bitcoin'},
+        {symbol: 'ethereum', name: 'Ethereum'},
+        {symbol: 'GC=F', name: 'Gold Futures'}
+    ];
+
+    // Built with textContent (no HTML parsing, names are never markup) and swapped in at once
+    const fragment = document.createDocumentFragment();
+    mockAssets.forEach(asset => {
+        const item = document.createElement('div');
+        item.className = 'compare-asset-item';
+        const icon = document.createElement('i');
+        icon.textContent = asset.symbol.charAt(0);
+        const label = document.createElement('span');
+        label.textContent = `${asset.name} (${asset.symbol})`;
+        item.append(icon, label);
+        item.dataset.action = 'compare-asset';
+        item.dataset.symbol = asset.symbol;
+        fragment.appendChild(item);
+    });
+    assetsList.replaceChildren(fragment);
+}
+
+function createComparisonRow(item, index) {
+    const isUp = item.change_percent >= 0;
+    const medal = index === 0 ? '🥇' : index === 1 ? '🥈' : index === 2 ? '🥉' : `${index + 1}`;
+    const row = document.createElement('tr');
+    row.style.borderBottom = '1px solid #3a3f5a';
+
+    const cells = [
+        [medal, 'left'],
+        [item.symbol, 'left'],
+        [item.current_price != null ? formatPrice(item.current_price) : 'N/A', 'right'],
+        [`${isUp ? '▲' : '▼'} ${priceFormat.format(item.change_percent || 0)}%`, 'right'],
+    ];
+    cells.forEach(([text, align]) => {
+        const cell = document.createElement('td');
+        cell.style.padding = '12px';
+        cell.style.textAlign = align;
+        cell.textContent = text;
+        row.appendChild(cell);
+    });
+    row.children[1].style.fontWeight = 'bold';
+    row.lastElementChild.className = isUp ? 'positive' : 'negative';
+    return row;
+}
+
+function toggleCompareAsset(symbol, element) {
+    if (selectedCompareAssets.has(symbol)) {
+        selectedCompareAssets.delete(symbol);
+        element.classList.remove('selected');
+    } else {
+        selectedCompareAssets.add(symbol);
+        element.classList.add('selected');
+    }
+
+    // Update comparison if at least 2 assets are selected
+    if (selectedCompareAssets.size >= 2) {
+        loadComparisonData();
+    } else {
+        document.getElementById('compareChartContainer').innerHTML = `
+            <div class="empty-state">
+                <i class="fas fa-chart-line"></i>
+                <h3>Select assets to compare</h3>
+                <p>Choose at least two assets to see their performance comparison</p>
+            </div>
+        `;
+    }
+}
+
+function loadComparisonData() {
+    if (selectedCompareAssets.size < 2) {
+        showNotification('Select at least 2 assets to compare', 'error');
+        return;
+    }
+
+    const symbols = Array.from(selectedCompareAssets).join(',');
+    showNotification(`Loading comparison data for ${symbols}...`);
+
+    fetch(`/api/assets/compare?symbols=${symbols}&period=30`)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error('Failed to load comparison data');
+            }
+            return response.json();
+        })
+        .then(data => {
+            const container = document.getElementById('compareChartContainer');
+
+            if (data.performance_ranking && data.performance_ranking.length > 0) {
+                // Static table shell; data rows are added as nodes (no per-row HTML parsing)
+                container.innerHTML = `
+                    <div style="padding: 20px;">
+                        <h3 style="margin-bottom: 20px;">Performance Comparison</h3>
+                        <div style="overflow-x: auto;">
+                            <table style="width: 100%; border-collapse: collapse;">
+                                <thead>
+                                    <tr style="background: #2a2f4a;">
+                                        <th style="padding: 12px; text-align: left; border-bottom: 2px solid #667eea;">Rank</th>
+                                        <th style="padding: 12px; text-align: left; border-bottom: 2px solid #667eea;">Symbol</th>
+                                        <th style="padding: 12px; text-align: right; border-bottom: 2px solid #667eea;">Price</th>
+                                        <th style="padding: 12px; text-align: right; border-bottom: 2px solid #667eea;">Change %</th>
+                                    </tr>
+                                </thead>
+                                <tbody></tbody>
+                            </table>
+                        </div>
+                        <p style="margin-top: 15px; color: #888; font-size: 0.9em;"></p>
+                    </div>
+                `;
+
+                const rows = document.createDocumentFragment();
+                data.performance_ranking.forEach((item, index) => {
+                    rows.appendChild(createComparisonRow(item, index));
+                });
+                container.querySelector('tbody').appendChild(rows);
+                container.querySelector('p').textContent =
+                    `Data updated: ${dateTimeFormat.format(new Date(data.timestamp))}`;
+                showNotification(`Comparison loaded for ${data.symbols.length} assets`);
+            } else {
+                container.innerHTML = `
+                    <div style="text-align: center; padding: 20px;">
+                        <i class="fas fa-exclamation-triangle" style="font-size: 3em; color: #e74c3c;"></i>
+                        <h3>No comparison data available</h3>
+                        <p>Try selecting different assets</p>
+                    </div>
+                `;
+                showNotification('No comparison data available', 'error');
+            }
+        })
+        .catch(error => {
+            console.error('Error loading comparison data:', error);
+            showNotification(`Error: ${error.message}`, 'error');
+
+            const container = document.getElementById('compareChartContainer');
+            container.innerHTML = `
+                <div style="text-align: center; padding: 20px;">
+                    <i class="fas fa-exclamation-triangle" style="font-size: 3em; color: #e74c3c;"></i>
+                    <h3>Error Loading Data</h3>
+                    <p></p>
+                </div>
+            `;
+            container.querySelector('p').textContent = error.message;
+        });
+}
+
+function closeCreateAlertModal() {
+    document.getElementById('createAlertModal').style.display = 'none';
+    document.getElementById('alertSymbol').value = '';
+    document.getElementById('alertPrice').value = '';
+}
+
+function createAlertFromModal() {
+    const symbol = document.getElementById('alertSymbol').value.trim().toUpperCase();
+    const price = parseFloat(document.getElementById('alertPrice').value);
+    const type = document.getElementById('alertType').value;
+
+    if (!symbol) {
+        showNotification('Please enter a symbol', 'error');
+        return;
+    }
+
+    if (isNaN(price) || price <= 0) {
+        showNotification('Please enter a valid price', 'error');
+        return;
+    }
+
+    if (ws && ws.readyState === WebSocket.OPEN) {
+        try {
+            ws.send(JSON.stringify({
+                action: 'create_alert',
+                symbol: symbol,
+                target_price: price,
+                alert_type: type
+            }));
+
+            closeCreateAlertModal();
+            showNotification(`Alert created for ${symbol} at $${price}`);
+        } catch (error) {
+            console.error('Error creating alert:', error);
+            showNotification('Error creating alert', 'error');
+        }
+    } else {
+        showNotification('Not connected to server', 'error');
+    }
+}
+
+function createAlert() {
+    const symbol = document.getElementById('alertSymbol').value.trim().toUpperCase();
+    const price = parseFloat(document.getElementById('alertPrice').value);
+    const type = document.getElementById('alertType').value;
+
+    if (symbol && !isNaN(price) && ws && ws.readyState === WebSocket.OPEN) {
+        ws.send(JSON.stringify({
+            action: 'create_alert',
+            symbol: symbol,
+            target_price: price,
+            alert_type: type
+        }));
+
+        document.getElementById('alertSymbol').value = '';
+        document.getElementById('alertPrice').value = '';
+        showNotification(`Alert created for ${symbol} at $${price}`);
+    }
+}
+
+function showNotification(message, type = 'success') {
+    const notification = dom.notification;
+    clearTimeout(notificationTimer);
+    notification.textContent = message;
+    notification.className = 'notification ' + (type === 'error' ? 'error' : 'show');
+
+    // Show notification
+    notification.classList.add('show');
+
+    // Hide 3 seconds after the latest message
+    notificationTimer = setTimeout(() => {
+        notification.classList.remove('show');
+    }, 3000);
+}
+
+// Tab switching
+function switchTab(tabName, tabElement) {
+    // Update active tab
+    activeTab = tabName;
+
+    // Update UI
+    activateInGroup(tabElement);
+
+    // Update dashboard
+    updateDashboard();
+}
+
+// Click handlers by data-action; each receives the element carrying the attribute
+const ACTIONS = {
+    'show-login': () => showLoginModal(),
+    'show-login-form': () => showLoginForm(),
+    'close-login': () => closeLoginModal(),
+    'login': () => login(),
+    'logout': () => logout(),
+    'show-register': () => showRegisterForm(),
+    'close-register': () => closeRegisterModal(),
+    'register': () => register(),
+    'search': () => searchAssets(),
+    'refresh': () => refreshData(),
+    'toggle-auto-refresh': el => toggleAutoRefresh(el),
+    'show-add-asset': () => showAddAssetModal(),
+    'close-add-asset': () => closeAddAssetModal(),
+    'add-asset': () => addAssetToWatchlist(),
+    'show-create-alert': () => showCreateAlertModal(''),
+    'close-create-alert': () => closeCreateAlertModal(),
+    'create-alert': () => createAlert(),
+    'create-alert-from-modal': () => createAlertFromModal(),
+    'export-data': el => exportData(el.dataset.format),
+    'close-export': () => closeExportModal(),
+    'show-compare': () => showCompareModal(),
+    'close-compare': () => closeCompareModal(),
+    'compare-asset': el => toggleCompareAsset(el.dataset.symbol, el),
+    'compare-period': el => updateComparePeriod(el.dataset.period, el),
+    'timeframe': el => updateTimeframe(el.dataset.interval, el),
+    'historical-period': el => updateHistoricalPeriod(el.dataset.period, el),
+    'tab': el => switchTab(el.dataset.tab, el),
+    'card-alert': el => showCreateAlertModal(el.closest('.card').dataset.symbol),
+    'card-export': el => showExportModal(el.closest('.card').dataset.symbol),
+    'card-watchlist': el => addToWatchlist(el.closest('.card').dataset.symbol),
+};
+
+function handleAction(event) {
+    const el = event.target.closest('[data-action]');
+    if (!el) return;
+    const action = ACTIONS[el.dataset.action];
+    if (action) action(el, event);
+}
+
+// Initialize
+function init() {
+    // One delegated listener serves every [data-action] element, including cards
+    // and compare items created later
+    document.body.addEventListener('click', handleAction);
+
+    // Check authentication status
+    checkAuthStatus();
+
+    document.addEventListener('visibilitychange', syncStreamWithVisibility);
+
+    // Show the last known state while the WebSocket connects
+    hydrateFromCache();
+
+    // Connect to WebSocket
+    connect();
+
+    // Set up auto refresh (on by default; the button shows the actual state)
+    if (autoRefreshEnabled) startAutoRefresh();
+    syncAutoRefreshButton(document.querySelector('[data-action="toggle-auto-refresh"]'));
+
+    // Handle Enter key in search box
+    document.getElementById('symbolInput').addEventListener('keypress', (e) => {
+        if (e.key === 'Enter') {
+            searchAssets();
+        }
+    });
+    document.getElementById('symbolInput').addEventListener('input', searchAssetsDebounced);
+
+    // Handle Enter key in login form
+    document.getElementById('loginPassword').addEventListener('keypress', (e) => {
+        if (e.key === 'Enter') {
+            login();
+        }
+    });
+}
+
+// Plotly is fetched on demand instead of blocking the first paint. The cards only draw
+// 'scatter' traces, so the basic bundle (~1 MB instead of ~3.5 MB) is enough; pinned to
+// the release plotly-latest resolves to. SVG scatter is kept on purpose: one WebGL
+// context per card would exceed the browser's context limit on a full dashboard.
+const PLOTLY_URL = 'https://cdn.plot.ly/plotly-basic-1.58.5.min.js';
+let plotlyPromise = null;
+
+function loadPlotly() {
+    if (window.Plotly) {
+        return Promise.resolve(window.Plotly);
+    }
+    if (!plotlyPromise) {
+        plotlyPromise = new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = PLOTLY_URL;
+            script.async = true;
+            script.onload = () => resolve(window.Plotly);
+            script.onerror = () => {
+                plotlyPromise = null;  // allow a retry on the next chart
+                reject(new Error('Failed to load chart library'));
+            };
+            document.head.appendChild(script);
+        });
+    }
+    return plotlyPromise;
+}
+
+// Card sparkline layout; a fresh object per chart because Plotly keeps and mutates
+// the layout it is given (autoranged axes), so one shared object would leak ranges
+function cardChartLayout() {
+    return {
+        paper_bgcolor: 'rgba(0,0,0,0)',
+        plot_bgcolor: 'rgba(0,0,0,0)',
+        margin: {l: 0, r: 0, t: 0, b: 30},
+        xaxis: {
+            type: 'date',
+            showgrid: false,
+            showticklabels: false
+        },
+        yaxis: {
+            showgrid: false,
+            showticklabels: false
+        },
+        showlegend: false
+    };
+}
+
+const CARD_CHART_CONFIG = {
+    displayModeBar: false
+};
+
+// Series last handed to Plotly per chart element, so a tick that only appends points
+// extends the trace instead of re-plotting it (cleared when the chart is purged)
+const plottedSeries = new WeakMap();
+
+// Points appended to the plotted series (0: unchanged), or -1 if it changed otherwise.
+// A sliding window is an append too: the new series starts inside the old one.
+function appendedPoints(plotted, timestamps, prices) {
+    const oldTimestamps = plotted.timestamps;
+    const oldCount = oldTimestamps.length;
+    const count = timestamps.length;
+    if (!oldCount || !count) return -1;
+
+    // The old last point must reappear in the new series with everything before it
+    const last = oldTimestamps[oldCount - 1];
+    let k = count - 1;
+    while (k >= 0 && timestamps[k] !== last) k--;
+    if (k < 0 || k >= oldCount) return -1;
+
+    const offset = oldCount - 1 - k;
+    for (let i = 0; i <= k; i++) {
+        if (timestamps[i] !== oldTimestamps[offset + i] || prices[i] !== plotted.prices[offset + i]) {
+            return -1;
+        }
+    }
+    return count - 1 - k;
+}
+
+function renderChart(symbol, chartData, size = null) {
+    const chartElement = document.getElementById(`chart-${symbol}`);
+    if (!chartElement || !chartData) return;
+
+    const layout = cardChartLayout();
+    if (size && size.width > 0 && size.height > 0) {
+        // Pre-measured by the caller: Plotly skips its own measuring pass
+        layout.width = size.width;
+        layout.height = size.height;
+    }
+
+    // Extract data for plotting: one pass into typed arrays; times become epoch ms
+    // (Date.parse, no Date objects) and the date-typed x axis reads them as dates
+    const count = chartData.length;
+    const timestamps = new Float64Array(count);
+    const prices = new Float64Array(count);
+    for (let i = 0; i < count; i++) {
+        const point = chartData[i];
+        timestamps[i] = Date.parse(point.time);
+        prices[i] = point.price || point.close;
+    }
+
+    const plotted = plottedSeries.get(chartElement);
+    const sameSize = plotted && (!size || (size.width === plotted.width && size.height === plotted.height));
+    const appended = sameSize ? appendedPoints(plotted, timestamps, prices) : -1;
+    if (appended === 0 && count === plotted.timestamps.length) return;  // nothing new
+    const series = {timestamps, prices, width: layout.width, height: layout.height};
+
+    if (appended > 0) {
+        // Last-bar fast path: only the new points are sent, the oldest ones drop off
+        const first = count - appended;
+        loadPlotly()
+            .then(Plotly => Plotly.extendTraces(chartElement, {
+                x: [Array.from(timestamps.subarray(first))],
+                y: [Array.from(prices.subarray(first))]
+            }, [0], count))
+            .then(() => plottedSeries.set(chartElement, series))
+            .catch(error => console.error('Error rendering chart:', error));
+        return;
+    }
+
+    // Create trace for the chart
+    const trace = {
+        x: timestamps,
+        y: prices,
+        type: 'scatter',
+        mode: 'lines',
+        line: {
+            color: '#667eea',
+            width: 2
+        },
+        fill: 'tozeroy',
+        fillcolor: 'rgba(102, 126, 234, 0.1)'
+    };
+
+    // Plotly.react creates the chart the first time and afterwards diffs the new trace
+    // into the existing plot instead of tearing it down like newPlot
+    loadPlotly()
+        .then(Plotly => Plotly.react(chartElement, [trace], layout, CARD_CHART_CONFIG))
+        .then(() => plottedSeries.set(chartElement, series))
+        .catch(error => console.error('Error rendering chart:', error));
+}
+
+// Start once the DOM (and deferred scripts) are ready; no need to wait for icons/fonts
+document.addEventListener('DOMContentLoaded', init);
@@ -115,6 +115,24 @@ class TestAuthManager:
         result = AuthManager.verify_token(token)
         assert result is None
 
+    def test_verify_token_login_token_user_id(self):
+        """Test verifying a login access token (user_id claim, no sub)"""
+        from datetime import datetime, timedelta
+
+        from jose import jwt
+
+        payload = {
+            "user_id": 42,
+            "username": "alice",
+            "exp": datetime.utcnow() + timedelta(hours=1),
+            "aud": SecurityConfig.JWT_AUDIENCE,
+            "iss": SecurityConfig.JWT_ISSUER,
+        }
+        token = jwt.encode(payload, AuthManager.SECRET_KEY, algorithm=AuthManager.ALGORITHM)
+
+        result = AuthManager.verify_token(token)
+        assert result == "42"
+
     @patch("app.services.auth_manager.jwt.decode")
     def test_verify_token_jwt_error(self, mock_decode):
         """Test verifying a token that raises JWTError"""
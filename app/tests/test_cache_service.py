@@ -173,6 +173,32 @@ class TestCacheService:
 
         asyncio.run(test_async())
 
+    def test_l1_hit_skips_redis(self):
+        """Test that a fresh L1 entry is served without a Redis round-trip"""
+
+        async def test_async():
+            from unittest.mock import AsyncMock, patch
+
+            redis_cache = self.cache_service.redis_cache
+            with patch.object(redis_cache, "get", AsyncMock(return_value=None)) as redis_get:
+                await self.cache_service.set("l1_key", {"price": 1.0}, ttl=30)
+
+                result = await self.cache_service.get("l1_key")
+                assert result == {"price": 1.0}
+                redis_get.assert_not_called()
+
+        asyncio.run(test_async())
+
+
+    def test_set_unserializable_value_skips_caching(self):
+        """Test that a value the encoder rejects is not cached and does not raise"""
+
+        async def test_async():
+            result = await self.cache_service.set("bad_key", {"value": object()})
+            assert result is False
+            assert await self.cache_service.get("bad_key") is None
+
+        asyncio.run(test_async())
 
 if __name__ == "__main__":
     pytest.main([__file__])
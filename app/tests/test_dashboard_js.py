@@ -0,0 +1,77 @@
+"""Tests for dashboard.js message handling (run in Node with a stubbed DOM)"""
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+DASHBOARD_JS = Path(__file__).resolve().parents[1] / "static" / "dashboard.js"
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+
+# Loads dashboard.js into a sandbox whose DOM lookups return inert stub elements, records
+# what each animation frame renders, then runs the test script in the same global scope
+HARNESS = """
+const vm = require('vm');
+const fs = require('fs');
+
+const element = () => ({
+    value: '', textContent: '', classList: {add() {}, remove() {}, toggle() {}},
+    addEventListener() {}, querySelector: () => null, querySelectorAll: () => [],
+});
+const frames = [];
+const context = vm.createContext({
+    console, Intl, Map, Set, WeakMap, Date, JSON, Math, Promise,
+    setTimeout: () => 0, clearTimeout() {},
+    requestAnimationFrame: callback => frames.push(callback),
+    document: {getElementById: element, addEventListener() {}, querySelectorAll: () => []},
+});
+context.window = context;
+vm.runInContext(fs.readFileSync(process.argv[1], 'utf8'), context);
+vm.runInContext(`
+    const rendered = [];
+    patchDashboard = assets => rendered.push(assets.map(a => [a.symbol, a.current_price]));
+    scheduleAssetsPersist = () => {};
+    const runFrames = () => frames.splice(0).forEach(callback => callback());
+`, context);
+context.frames = frames;
+process.stdout.write(JSON.stringify(vm.runInContext(process.argv[2], context)));
+"""
+
+
+def run_dashboard(script: str):
+    """Run a script against dashboard.js and return its JSON-encoded result"""
+    result = subprocess.run(
+        ["node", "-e", HARNESS, str(DASHBOARD_JS), script],
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+
+def asset(symbol: str, price: float) -> dict:
+    return {"symbol": symbol, "name": symbol, "type": "stock", "current_price": price}
+
+
+def test_batch_snapshot_then_update_renders_latest_prices():
+    """A tick merged after a snapshot in the same frame is not lost"""
+    timestamp = "2024-01-01T00:00:00"
+    batch = {
+        "type": "batch",
+        "items": [
+            {
+                "type": "snapshot",
+                "data": [asset("AAPL", 1.0), asset("MSFT", 2.0)],
+                "timestamp": timestamp,
+            },
+            {"type": "update", "data": [asset("AAPL", 3.0)], "timestamp": timestamp},
+        ],
+    }
+
+    rendered = run_dashboard(f"handleMessage({json.dumps(batch)}); runFrames(); rendered")
+
+    assert rendered == [[["AAPL", 3.0], ["MSFT", 2.0]]]
@@ -1,11 +1,13 @@
 """Tests for the enhanced data fetcher"""
 
-from unittest.mock import AsyncMock, patch
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pandas as pd
 import pytest
 
 from app.exceptions.custom_exceptions import DataFetchError
-from app.services.data_fetcher import DataFetcher
+from app.services.data_fetcher import DataFetcher, _ohlc_chart_points
 
 
 class TestDataFetcher:
@@ -169,6 +171,57 @@ class TestDataFetcher:
         assert "current_price" in result
         assert "chart_data" in result
 
+    @pytest.mark.asyncio
+    async def test_prefetch_crypto_prices_single_request(self):
+        """Test that prices for all coins are fetched with one simple/price call"""
+        response = MagicMock()
+        response.status = 200
+        response.json = AsyncMock(
+            return_value={
+                "bitcoin": {"usd": 45000.0, "usd_24h_change": 1.5},
+                "ethereum": {"usd": 3000.0, "usd_24h_change": -0.5},
+            }
+        )
+        request_ctx = MagicMock()
+        request_ctx.__aenter__ = AsyncMock(return_value=response)
+        request_ctx.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock()
+        session.get = MagicMock(return_value=request_ctx)
+
+        with patch.object(self.data_fetcher, "_get_http_session", AsyncMock(return_value=session)):
+            fetched = await self.data_fetcher.prefetch_crypto_prices(
+                ["bitcoin", "ethereum", "bitcoin"]
+            )
+
+        assert fetched == 2
+        assert session.get.call_count == 1
+        assert session.get.call_args.kwargs["params"]["ids"] == "bitcoin,ethereum"
+        assert self.data_fetcher._get_snapshot_price("ethereum")["usd"] == 3000.0
+
+    @pytest.mark.asyncio
+    async def test_fetch_from_coingecko_uses_price_snapshot(self):
+        """Test that a fresh batched snapshot avoids the per-coin price request"""
+        self.data_fetcher._crypto_price_snapshot["bitcoin"] = (
+            time.time(),
+            {"usd": 45000.0, "usd_24h_change": 1.5, "usd_24h_vol": 10.0},
+        )
+        session = MagicMock()
+        cache = MagicMock()
+        cache.get = AsyncMock(return_value=None)
+        cache.set = AsyncMock(return_value=True)
+
+        with (
+            patch.object(self.data_fetcher, "_get_http_session", AsyncMock(return_value=session)),
+            patch.object(self.data_fetcher, "_fetch_coingecko_chart", AsyncMock(return_value=[])),
+            patch.object(self.data_fetcher, "cache_service", cache),
+            patch.object(self.data_fetcher, "rate_limit_delay", 0),
+        ):
+            result = await self.data_fetcher._fetch_from_coingecko("bitcoin")
+
+        session.get.assert_not_called()
+        assert result["current_price"] == 45000.0
+        assert result["change_percent"] == 1.5
+
     @pytest.mark.asyncio
     async def test_get_multiple_assets_success(self):
         """Test getting multiple assets successfully"""
@@ -210,5 +263,45 @@ class TestDataFetcher:
             assert result[1]["symbol"] == "bitcoin"
 
 
+    def test_ohlc_chart_points_fills_missing_values(self):
+        """History frame is converted column-wise with fallbacks for gaps"""
+        df = pd.DataFrame(
+            {
+                "Open": [1.0, None],
+                "High": [2.0, 3.0],
+                "Low": [0.5, 1.5],
+                "Close": [1.5, 2.5],
+                "Volume": [100, None],
+            },
+            index=["t0", "t1"],
+        )
+
+        points = _ohlc_chart_points(df, fallback_price=9.0)
+
+        assert points == [
+            {"time": "t0", "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 100},
+            {"time": "t1", "open": 9.0, "high": 3.0, "low": 1.5, "close": 2.5, "volume": 0},
+        ]
+        assert type(points[0]["volume"]) is int
+
+    def test_ohlc_chart_points_bad_values_keep_real_history(self):
+        """Malformed Close/Volume values fall back per value, not to mock data"""
+        df = pd.DataFrame(
+            {
+                "Open": [1.0, 2.0, 3.0],
+                "High": [2.0, 3.0, 4.0],
+                "Low": [0.5, 1.5, 2.5],
+                "Close": [1.5, float("nan"), "n/a"],
+                "Volume": [100, "bad", float("inf")],
+            },
+            index=["t0", "t1", "t2"],
+        )
+
+        points = _ohlc_chart_points(df, fallback_price=9.0)
+
+        assert [p["open"] for p in points] == [1.0, 2.0, 3.0]
+        assert [p["close"] for p in points] == [1.5, 9.0, 9.0]
+        assert [p["volume"] for p in points] == [100, 0, 0]
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -447,10 +447,15 @@ class TestDataFetcherEnhancedErrors:
                 "app.services.data_fetcher.DataFetcher.get_crypto_data",
                 side_effect=mock_get_crypto_data,
             ),
-            patch.object(self.data_fetcher.cache_service, "warm_cache", AsyncMock(return_value=2)),
+            patch.object(self.data_fetcher, "prefetch_crypto_prices", AsyncMock(return_value=0)),
+            patch.object(
+                self.data_fetcher.cache_service, "warm_cache", AsyncMock(return_value=2)
+            ) as mock_warm_cache,
         ):
             await self.data_fetcher.initialize_cache_warming()
             # Should complete without crashing even with some failures
+            warm_data = mock_warm_cache.await_args.args[0]
+            assert set(warm_data) == {"stock_AAPL_1d_5m", "crypto_bitcoin"}
 
 
 if __name__ == "__main__":
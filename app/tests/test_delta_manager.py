@@ -180,6 +180,31 @@ class TestDeltaManager:
         stats = self.delta_manager.get_stats()
         assert stats["tracked_symbols"] == 2
 
+    def test_changed_mask(self):
+        """Test vectorized change detection across ticks"""
+        tick = [
+            {"symbol": "AAPL", "current_price": 150.0, "volume": None},
+            {"symbol": "BTC", "current_price": 50000.0, "volume": 10},
+        ]
+        # First sight: everything is new
+        assert self.delta_manager.changed_mask(tick) == [True, True]
+        # Same values (including missing ones): nothing changed
+        assert self.delta_manager.changed_mask(tick) == [False, False]
+
+        tick[1] = {**tick[1], "current_price": 50000.01}
+        assert self.delta_manager.changed_mask(tick) == [False, True]
+
+        # A cleared symbol is reported as new again
+        self.delta_manager.clear_symbol_data("AAPL")
+        assert self.delta_manager.changed_mask(tick) == [True, False]
+        assert self.delta_manager.get_stats()["tracked_symbols"] == 2
+
+        # Growing past the initial capacity keeps earlier rows
+        many = [{"symbol": f"S{i}", "current_price": float(i)} for i in range(20)]
+        assert all(self.delta_manager.changed_mask(many))
+        assert self.delta_manager.changed_mask(tick) == [False, False]
+        assert self.delta_manager.changed_mask([]) == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
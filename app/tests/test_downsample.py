@@ -0,0 +1,35 @@
+"""Tests for LTTB chart downsampling"""
+
+from app.utils.downsample import lttb_downsample, lttb_indices
+
+
+def test_small_series_unchanged():
+    """Test that series within the threshold are returned as is"""
+    points = [{"time": str(i), "price": float(i)} for i in range(10)]
+    assert lttb_downsample(points, threshold=20) == points
+
+
+def test_downsample_keeps_endpoints_and_size():
+    """Test that downsampling keeps first/last points and respects the threshold"""
+    points = [{"time": str(i), "price": float(i % 7)} for i in range(1000)]
+    sampled = lttb_downsample(points, threshold=200)
+    assert len(sampled) == 200
+    assert sampled[0] is points[0]
+    assert sampled[-1] is points[-1]
+    times = [int(p["time"]) for p in sampled]
+    assert times == sorted(times)
+
+
+def test_downsample_preserves_spike():
+    """Test that a single spike survives (stride sampling would drop it)"""
+    values = [1.0] * 1000
+    values[501] = 50.0
+    assert 501 in lttb_indices(values, 50)
+
+
+def test_downsample_pairs_by_index():
+    """Test downsampling raw [timestamp, value] pairs"""
+    pairs = [[i * 1000, float(i)] for i in range(300)]
+    sampled = lttb_downsample(pairs, threshold=30, value_key=1)
+    assert len(sampled) == 30
+    assert sampled[0] == pairs[0] and sampled[-1] == pairs[-1]
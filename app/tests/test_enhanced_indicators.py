@@ -24,6 +24,19 @@ def test_parabolic_sar():
     assert result["trend"] in ["bullish", "bearish"]
 
 
+def test_obv_and_cci_values():
+    """Test OBV and CCI against hand-computed values"""
+    close = pd.Series([1.0, 2.0, 2.0, 1.0])
+    volume = pd.Series([10.0, 20.0, 30.0, 40.0])
+    # 10 + 20 (up) + 0 (flat) - 40 (down)
+    assert TechnicalIndicators.calculate_obv(close, volume) == -10.0
+
+    prices = pd.Series([1.0, 2.0, 3.0])
+    # Typical price mean 2, mean deviation 2/3: (3 - 2) / (0.015 * 2/3)
+    cci = TechnicalIndicators.calculate_cci(prices, prices, prices, period=3)
+    assert abs(cci - 100.0) < 1e-9
+
+
 def test_vwap():
     """Test VWAP calculation"""
     # Create sample data
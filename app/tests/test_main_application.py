@@ -31,6 +31,20 @@ class TestMainApplication:
         assert "status" in data
         assert "timestamp" in data
         assert "services" in data
+        assert data["status"] in ("healthy", "starting")
+        assert data["services"] == {"database": "unknown", "redis": "unknown", "alerts": "unknown"}
+        assert response.headers["content-type"] == "application/json"
+
+    def test_health_timestamp_cached_per_second(self):
+        """The health timestamp is formatted once per second"""
+        from app import main
+
+        with patch("app.main.time.time", return_value=1_700_000_000.2):
+            first = main._health_timestamp()
+        with patch("app.main.time.time", return_value=1_700_000_000.9):
+            assert main._health_timestamp() is first
+        with patch("app.main.time.time", return_value=1_700_000_001.0):
+            assert main._health_timestamp() != first
 
     def test_docs_endpoints(self):
         """Test that documentation endpoints are available"""
@@ -49,7 +63,7 @@ class TestMainApplication:
             headers={
                 "Origin": "http://localhost:3000",
                 "Access-Control-Request-Method": "GET",
-                "Access-Control-Request-Headers": "X-Example",
+                "Access-Control-Request-Headers": "Content-Type",
             },
         )
         # CORS middleware should allow the request
@@ -64,10 +78,10 @@ class TestMainApplication:
         """Test successful lifespan startup"""
         # Mock all the services to succeed
         with (
-            patch("app.main.init_db") as mock_init_db,
-            patch("app.main.get_redis_cache_service") as mock_get_redis,
-            patch("app.main.get_monitoring_service") as mock_get_monitoring,
-            patch("app.main.get_advanced_alert_service") as mock_get_alerts,
+            patch("app.database.init_db") as mock_init_db,
+            patch("app.services.redis_cache_service.get_redis_cache_service") as mock_get_redis,
+            patch("app.services.monitoring_service.get_monitoring_service") as mock_get_monitoring,
+            patch("app.services.advanced_alert_service.get_advanced_alert_service") as mock_get_alerts,
             patch("app.main.data_stream_worker", new_callable=AsyncMock),
             patch("app.database.SessionLocal") as mock_session_local,
         ):
@@ -76,7 +90,7 @@ class TestMainApplication:
             mock_session_local.return_value = mock_db
 
             # Mock database service import
-            with patch("services.database_service.DatabaseService") as mock_db_service_class:
+            with patch("app.services.database_service.DatabaseService") as mock_db_service_class:
                 # Mock database service
                 mock_db_service = Mock()
                 mock_db_service_class.return_value = mock_db_service
@@ -100,29 +114,39 @@ class TestMainApplication:
                 mock_get_alerts.return_value = mock_alert_service
 
                 # Mock DataFetcher
-                with patch("app.main.DataFetcher") as mock_data_fetcher_class:
+                with patch("app.api.routes.get_data_fetcher") as mock_get_data_fetcher:
                     mock_data_fetcher = AsyncMock()
                     mock_data_fetcher.initialize_cache_warming = AsyncMock(return_value=None)
-                    mock_data_fetcher_class.return_value = mock_data_fetcher
+                    mock_get_data_fetcher.return_value = mock_data_fetcher
 
                     # Test lifespan using TestClient (automatically runs lifespan)
                     with TestClient(app):
                         # Verify startup services were initialized
                         mock_init_db.assert_called_once()
                         mock_redis_service.connect.assert_called_once()
+                        assert app.state.monitoring is mock_monitoring_service
+                        assert app.state.worker_task.get_name() == "data_stream_worker"
+
+                    # The worker is cancelled and awaited when the lifespan exits
+                    assert app.state.worker_task.done()
+
+                    # Do not leak the mock into other tests
+                    del app.state.monitoring
 
                     # After context exit, shutdown should have been called
                     mock_alert_service.stop_monitoring.assert_called_once()
+                    # Shutdown reuses the startup instance instead of building a new one
+                    mock_get_alerts.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_lifespan_redis_failure(self):
         """Test lifespan startup with Redis connection failure"""
         # Mock services with Redis failure
         with (
-            patch("app.main.init_db") as mock_init_db,
-            patch("app.main.get_redis_cache_service") as mock_get_redis,
-            patch("app.main.get_monitoring_service") as mock_get_monitoring,
-            patch("app.main.get_advanced_alert_service") as mock_get_alerts,
+            patch("app.database.init_db") as mock_init_db,
+            patch("app.services.redis_cache_service.get_redis_cache_service") as mock_get_redis,
+            patch("app.services.monitoring_service.get_monitoring_service") as mock_get_monitoring,
+            patch("app.services.advanced_alert_service.get_advanced_alert_service") as mock_get_alerts,
             patch("app.main.data_stream_worker", new_callable=AsyncMock),
             patch("app.database.SessionLocal") as mock_session_local,
         ):
@@ -131,7 +155,7 @@ class TestMainApplication:
             mock_session_local.return_value = mock_db
 
             # Mock database service import
-            with patch("services.database_service.DatabaseService") as mock_db_service_class:
+            with patch("app.services.database_service.DatabaseService") as mock_db_service_class:
                 # Mock database service
                 mock_db_service = Mock()
                 mock_db_service_class.return_value = mock_db_service
@@ -154,10 +178,10 @@ class TestMainApplication:
                 mock_get_alerts.return_value = mock_alert_service
 
                 # Mock DataFetcher
-                with patch("app.main.DataFetcher") as mock_data_fetcher_class:
+                with patch("app.api.routes.get_data_fetcher") as mock_get_data_fetcher:
                     mock_data_fetcher = AsyncMock()
                     mock_data_fetcher.initialize_cache_warming = AsyncMock(return_value=None)
-                    mock_data_fetcher_class.return_value = mock_data_fetcher
+                    mock_get_data_fetcher.return_value = mock_data_fetcher
 
                     # Test lifespan - should not raise exception even with Redis failure
                     with TestClient(app):
@@ -165,6 +189,31 @@ class TestMainApplication:
                         mock_init_db.assert_called_once()
                         mock_redis_service.connect.assert_called_once()
 
+                    del app.state.monitoring
+
+    def test_cors_preflight_headers(self):
+        """Test that preflight allows only the configured methods/headers"""
+        response = self.client.options(
+            "/api/assets",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "Content-Type, Authorization",
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["access-control-max-age"] == "86400"
+        assert "access-control-allow-credentials" not in response.headers
+
+        response = self.client.options(
+            "/api/assets",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "PATCH",
+            },
+        )
+        assert response.status_code == 400
+
     def test_dashboard_endpoint(self):
         """Test that the dashboard endpoint returns HTML content"""
         response = self.client.get("/")
@@ -174,6 +223,81 @@ class TestMainApplication:
         assert "<title>FastAPI Finance Monitor</title>" in response.text
         assert "dashboard" in response.text.lower()
 
+    def test_dashboard_minified(self):
+        """Test that the dashboard is served without comments and indentation"""
+        html = self.client.get("/").text
+        assert "<!--" not in html
+        assert "\n " not in html
+        assert 'id="loginModal"' in html
+
+    def test_dashboard_response_reused(self):
+        """Test that the prebuilt dashboard response is shared and not mutated per request"""
+        from app import main
+
+        request = Mock()
+        request.headers = {"accept-encoding": "gzip"}
+        response = main._DASHBOARD.response(request)
+        assert main._DASHBOARD.response(request) is response
+
+        raw_headers = list(response.raw_headers)
+        for _ in range(2):
+            assert self.client.get("/", headers={"Accept-Encoding": "gzip"}).status_code == 200
+        assert response.raw_headers == raw_headers
+
+    def test_dashboard_not_modified(self):
+        """Test that the dashboard honours If-None-Match with a 304"""
+        response = self.client.get("/")
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "public, max-age=300"
+
+        cached = self.client.get("/", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        # Proxies may weaken the tag or send several candidates
+        cached = self.client.get("/", headers={"If-None-Match": f'"stale", W/{etag}'})
+        assert cached.status_code == 304
+        assert self.client.get("/", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+    def test_static_assets_precompressed(self):
+        """Test that dashboard CSS/JS are served gzip-encoded when accepted"""
+        response = self.client.get("/static/dashboard.js", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert "javascript" in response.headers["content-type"]
+        assert "function connect()" in response.text
+
+        response = self.client.get("/static/dashboard.css", headers={"Accept-Encoding": "identity"})
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        # Minified once at load time
+        assert "/*" not in response.text
+        assert "\n" not in response.text.strip()
+
+        response = self.client.get("/static/missing.js")
+        assert response.status_code == 404
+
+    def test_dynamic_responses_gzipped(self):
+        """Test that large dynamic responses are gzip-encoded when accepted"""
+        response = self.client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "openapi" in response.json()
+
+    def test_dashboard_links_versioned_assets(self):
+        """Test that the dashboard references content-hashed, immutable CSS/JS"""
+        import re
+
+        html = self.client.get("/").text
+        css_url = re.search(r'href="(/static/dashboard\.[0-9a-f]+\.css)"', html).group(1)
+        js_url = re.search(r'src="(/static/dashboard\.[0-9a-f]+\.js)"', html).group(1)
+
+        for url in (css_url, js_url):
+            response = self.client.get(url)
+            assert response.status_code == 200
+            assert "immutable" in response.headers["cache-control"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -1,5 +1,7 @@
 """Tests for the Redis cache service"""
 
+from unittest.mock import ANY, AsyncMock
+
 import pytest
 
 from app.services.redis_cache_service import RedisCacheService
@@ -10,5 +12,47 @@ def test_redis_cache_service_import():
     assert RedisCacheService is not None
 
 
+@pytest.mark.asyncio
+async def test_acquire_lock_single_flight():
+    """Only the first caller acquires the SET NX lock; release is owner-only"""
+    service = RedisCacheService()
+    service.redis_client = AsyncMock()
+    service.redis_client.ping.return_value = True
+    service.redis_client.set.side_effect = [True, None]
+    service.redis_client.eval.return_value = 1
+
+    token = await service.acquire_lock("warmup:lock", ttl=30)
+    assert token
+    assert await service.acquire_lock("warmup:lock", ttl=30) is None
+    service.redis_client.set.assert_called_with("warmup:lock", ANY, nx=True, ex=30)
+
+    assert await service.release_lock("warmup:lock", token) is True
+    assert service.redis_client.eval.call_args.args[-1] == token
+
+
+@pytest.mark.asyncio
+async def test_acquire_lock_without_redis():
+    """Without Redis the caller runs alone and always owns the lock"""
+    service = RedisCacheService()
+    service.redis_client = None
+    assert await service.acquire_lock("warmup:lock") is not None
+
+
+@pytest.mark.asyncio
+async def test_extend_lock_owner_only():
+    """Only the lock owner can extend it; without Redis the lock is always kept"""
+    service = RedisCacheService()
+    service.redis_client = AsyncMock()
+    service.redis_client.ping.return_value = True
+    service.redis_client.eval.side_effect = [1, 0]
+
+    assert await service.extend_lock("leader", "token", ttl=60) is True
+    assert service.redis_client.eval.call_args.args[-2:] == ("token", 60)
+    assert await service.extend_lock("leader", "token", ttl=60) is False
+
+    service.redis_client = None
+    assert await service.extend_lock("leader", "token") is True
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,101 @@
+"""Tests for fast JSON serialization helpers"""
+
+import zlib
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.utils.serialization import (
+    BACKEND,
+    PreparedMessage,
+    batch_frame_packed,
+    batch_frame_text,
+    dumps,
+    dumps_str,
+    loads,
+)
+
+
+def test_backend_selected():
+    """Test that a serialization backend is selected"""
+    assert BACKEND in ("msgspec", "orjson", "json")
+
+
+def test_dumps_roundtrip():
+    """Test that asset payloads survive a dumps/loads roundtrip"""
+    payload = {
+        "type": "update",
+        "data": [{"symbol": "AAPL", "current_price": 150.25, "chart_data": []}],
+    }
+    encoded = dumps(payload)
+    assert isinstance(encoded, bytes)
+    assert loads(encoded) == payload
+    assert loads(dumps_str(payload)) == payload
+
+
+def test_dumps_handles_datetime():
+    """Test that non-JSON types are converted instead of raising"""
+    decoded = loads(dumps({"timestamp": datetime(2024, 1, 1, 12, 0)}))
+    assert decoded["timestamp"].startswith("2024-01-01")
+
+
+def test_dumps_keeps_numpy_scalars_numeric():
+    """Test that pandas/NumPy values are encoded as numbers, not strings"""
+    decoded = loads(
+        dumps(
+            {
+                "price": np.float64(1.5),
+                "volume": np.int64(1000),
+                "closes": np.array([1.0, 2.0]),
+                "timestamp": datetime(2024, 1, 1, 12, 0),
+            }
+        )
+    )
+    assert decoded == {
+        "price": 1.5,
+        "volume": 1000,
+        "closes": [1.0, 2.0],
+        "timestamp": "2024-01-01T12:00:00",
+    }
+    assert isinstance(decoded["volume"], int)
+
+
+def test_dumps_rejects_unsupported_types():
+    """Test that unknown types raise instead of being silently stringified"""
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+def test_prepared_message_encodes_once():
+    """Test that a prepared message caches its JSON text"""
+    message = PreparedMessage({"type": "update", "data": []})
+    assert message.text is message.text
+    assert loads(batch_frame_text([message.text, message.text])) == {
+        "type": "batch",
+        "items": [{"type": "update", "data": []}] * 2,
+    }
+
+
+def test_prepared_message_deflated_once():
+    """Test that the compressed encoding is computed once and inflates to the JSON text"""
+    message = PreparedMessage({"type": "update", "data": [{"symbol": "AAPL"}] * 50})
+    assert message.deflated is message.deflated
+    assert zlib.decompress(message.deflated).decode("utf-8") == message.text
+
+
+def test_fast_json_response_renders_body():
+    """Test that FastJSONResponse encodes content with the fast serializer"""
+    from app.utils.responses import FastJSONResponse
+
+    response = FastJSONResponse({"status": "healthy", "services": {"redis": "unknown"}})
+    assert response.media_type == "application/json"
+    assert loads(response.body) == {"status": "healthy", "services": {"redis": "unknown"}}
+
+
+def test_batch_frame_packed_header():
+    """Test the hand-encoded MessagePack batch header for each array size class"""
+    prefix = b"\x82\xa4type\xa5batch\xa5items"
+    assert batch_frame_packed([b"\x01", b"\x02"]) == prefix + b"\x92\x01\x02"
+    assert batch_frame_packed([b"\xc0"] * 20) == prefix + b"\xdc\x00\x14" + b"\xc0" * 20
+    assert batch_frame_packed([b"\xc0"] * 70000).startswith(prefix + b"\xdd\x00\x01\x11\x70")
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from app.api.websocket import WebSocketManager
+from app.utils.serialization import PreparedMessage
 
 
 def test_websocket_manager_initialization():
@@ -128,5 +129,360 @@ async def test_websocket_manager_data_stream_worker():
                     # We're just testing that it doesn't crash
 
 
+@pytest.mark.asyncio
+async def test_data_stream_worker_serializes_once_for_shared_symbols():
+    """Test that clients sharing a symbol all get the update from one serialized frame"""
+    manager = WebSocketManager()
+    first, second = AsyncMock(), AsyncMock()
+    manager.connection_manager.active_connections[first] = {"id": "client_1"}
+    manager.connection_manager.active_connections[second] = {"id": "client_2"}
+    manager.subscription_manager.subscribe("client_1", ["AAPL"])
+    manager.subscription_manager.subscribe("client_2", ["AAPL"])
+
+    async def stop_after_tick(_delay):
+        manager.shutdown_event.set()
+
+    with (
+        patch.object(
+            manager.data_manager,
+            "get_assets_data",
+            AsyncMock(return_value=[{"symbol": "AAPL", "current_price": 150.0}]),
+        ),
+        patch.object(
+            manager.connection_manager, "broadcast_serialized", AsyncMock()
+        ) as mock_broadcast,
+        patch("app.api.websocket.asyncio.sleep", side_effect=stop_after_tick),
+    ):
+        await manager.data_stream_worker()
+
+    mock_broadcast.assert_called_once()
+    message, websockets = mock_broadcast.call_args.args
+    assert set(websockets) == {first, second}
+    assert '"AAPL"' in message.text
+
+
+@pytest.mark.asyncio
+async def test_stream_leader_fetches_and_publishes_follower_symbols():
+    """Test that the leader fetches symbols requested by followers and publishes the tick"""
+    manager = WebSocketManager()
+    redis_cache = AsyncMock()
+    redis_cache.acquire_lock.return_value = "token"
+    redis_cache.get_pattern_values.return_value = [b"TSLA,AAPL"]
+    assets = [{"symbol": "AAPL"}, {"symbol": "TSLA"}]
+
+    with (
+        patch("app.api.websocket.get_redis_cache_service", return_value=redis_cache),
+        patch.object(manager, "fetch_assets", AsyncMock(return_value=assets)) as mock_fetch,
+    ):
+        assert await manager.next_tick(["AAPL"]) == assets
+
+    mock_fetch.assert_awaited_once_with(["AAPL", "TSLA"])
+    redis_cache.publish.assert_awaited_once()
+    assert manager.stream_leader_token == "token"
+
+
+@pytest.mark.asyncio
+async def test_stream_follower_receives_leader_tick():
+    """Test that a follower advertises its symbols and uses the leader's tick"""
+    manager = WebSocketManager()
+    subscription = AsyncMock()
+    subscription.get_message.return_value = {"data": b'[{"symbol":"AAPL"}]'}
+    redis_cache = AsyncMock()
+    redis_cache.acquire_lock.return_value = None
+    redis_cache.subscribe.return_value = subscription
+
+    with (
+        patch("app.api.websocket.get_redis_cache_service", return_value=redis_cache),
+        patch.object(manager, "fetch_assets", AsyncMock()) as mock_fetch,
+    ):
+        assert await manager.next_tick(["AAPL"]) == [{"symbol": "AAPL"}]
+        await manager.release_stream_leadership()
+
+    mock_fetch.assert_not_awaited()
+    assert redis_cache.set.call_args.args[1] == b"AAPL"
+    subscription.aclose.assert_awaited_once()
+    redis_cache.release_lock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_serialized_chunks_large_client_lists():
+    """Test that large broadcasts are sent in chunks with a yield between them"""
+    from app.managers.connection_manager import BROADCAST_BATCH_SIZE
+
+    manager = WebSocketManager()
+    websockets = [AsyncMock() for _ in range(BROADCAST_BATCH_SIZE * 2 + 1)]
+
+    with patch("app.managers.connection_manager.asyncio.sleep", AsyncMock()) as mock_sleep:
+        await manager.connection_manager.broadcast_serialized('{"type":"update"}', websockets)
+
+    assert all(ws.send_text.await_count == 1 for ws in websockets)
+    assert mock_sleep.await_count == 2
+    assert manager.connection_manager.broadcast_queue_size == 0
+
+
+@pytest.mark.asyncio
+async def test_client_sender_coalesces_queued_messages():
+    """Test that messages queued while a send is pending go out as one batch frame"""
+    import asyncio
+    import json
+
+    manager = WebSocketManager()
+    websocket = AsyncMock()
+    await manager.connection_manager.connect(websocket, "client_1")
+
+    for i in range(3):
+        message = PreparedMessage({"n": i})
+        assert await manager.connection_manager._send_to_client(websocket, message)
+    await asyncio.sleep(0.01)
+
+    websocket.send_text.assert_awaited_once()
+    frame = json.loads(websocket.send_text.await_args.args[0])
+    assert frame == {"type": "batch", "items": [{"n": 0}, {"n": 1}, {"n": 2}]}
+
+    await manager.connection_manager.disconnect(websocket)
+    assert websocket not in manager.connection_manager.client_sender_tasks
+
+
+@pytest.mark.asyncio
+async def test_reply_is_queued_behind_pending_snapshot():
+    """Test that replies go through the client queue and never overtake a snapshot"""
+    import asyncio
+    import json
+
+    manager = WebSocketManager()
+    connection_manager = manager.connection_manager
+    websocket = AsyncMock()
+    await connection_manager.connect(websocket, "client_1")
+
+    await connection_manager.send_snapshot(websocket, {"type": "snapshot", "data": []})
+    assert await connection_manager.send_message(websocket, {"type": "notification"})
+    await asyncio.sleep(0.01)
+
+    # One writer: both messages leave in order from the sender task, as one batch frame
+    websocket.send_text.assert_awaited_once()
+    frame = json.loads(websocket.send_text.await_args.args[0])
+    assert [item["type"] for item in frame["items"]] == ["snapshot", "notification"]
+
+    await connection_manager.disconnect(websocket)
+
+
+@pytest.mark.asyncio
+async def test_full_client_queue_drops_oldest_message():
+    """Test that a full client queue keeps the newest snapshots and drops stale peers"""
+    from app.managers.connection_manager import MAX_QUEUE_SIZE, SLOW_CLIENT_TIMEOUT
+
+    manager = WebSocketManager()
+    connection_manager = manager.connection_manager
+    websocket = AsyncMock()
+    await connection_manager.connect(websocket, "client_1")
+    queue = connection_manager.client_message_queues[websocket]
+
+    for i in range(MAX_QUEUE_SIZE + 1):
+        assert await connection_manager._send_to_client(websocket, PreparedMessage({"n": i}))
+
+    assert queue.qsize() == MAX_QUEUE_SIZE
+    assert queue.get_nowait().text == '{"n":1}'
+    assert connection_manager.active_connections[websocket]["needs_snapshot"] is True
+
+    # Queue full for longer than the timeout: the client is reported as dead
+    queue.put_nowait(PreparedMessage({"n": -1}))
+    info = connection_manager.active_connections[websocket]
+    info["queue_full_since"] -= SLOW_CLIENT_TIMEOUT + 1
+    assert not await connection_manager._send_to_client(websocket, PreparedMessage({"n": 0}))
+
+    await connection_manager.disconnect(websocket)
+
+
+@pytest.mark.asyncio
+async def test_slow_client_gets_snapshot_after_dropped_delta():
+    """Test that a client whose queue dropped a delta is resynced with a full snapshot"""
+    import asyncio
+    import json
+
+    from app.managers.connection_manager import MAX_QUEUE_SIZE
+
+    manager = WebSocketManager()
+    connection_manager = manager.connection_manager
+    websocket = AsyncMock()
+    await connection_manager.connect(websocket, "client_1")
+    manager.subscription_manager.subscribe("client_1", ["AAPL"])
+
+    # The sender task has not run yet: the queue overflows and the oldest delta is lost
+    for i in range(MAX_QUEUE_SIZE + 1):
+        await connection_manager._send_to_client(websocket, PreparedMessage({"n": i}))
+    assert connection_manager.active_connections[websocket]["needs_snapshot"]
+
+    async def stop_after_tick(_delay):
+        manager.shutdown_event.set()
+
+    assets = [{"symbol": "AAPL", "current_price": 150.0}]
+    with (
+        patch.object(manager.data_manager, "get_assets_data", AsyncMock(return_value=assets)),
+        patch("app.api.websocket.asyncio.sleep", side_effect=stop_after_tick),
+    ):
+        await manager.data_stream_worker()
+    await asyncio.sleep(0.01)
+
+    frames = [json.loads(call.args[0]) for call in websocket.send_text.await_args_list]
+    # The tick reaches the client as a full snapshot, not as another delta
+    assert frames[-1] == {"type": "snapshot", "timestamp": frames[-1]["timestamp"], "data": assets}
+    assert all(frame["type"] != "update" for frame in frames)
+    assert "needs_snapshot" not in connection_manager.active_connections[websocket]
+
+    await connection_manager.disconnect(websocket)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "action",
+    ['{"action": "subscribe", "symbols": ["tsla"]}', '{"action": "add_asset", "symbol": "tsla"}'],
+)
+async def test_new_subscription_receives_current_data(action):
+    """Test that a symbol added mid-session is delivered without waiting for a change"""
+    import asyncio
+    import json
+
+    manager = WebSocketManager()
+    websocket = AsyncMock()
+    await manager.connection_manager.connect(websocket, "client_1")
+    assets = [{"symbol": "TSLA", "current_price": 200.0}]
+
+    with patch.object(
+        manager.data_manager, "get_assets_data", AsyncMock(return_value=assets)
+    ) as mock_get:
+        await manager.handle_message(websocket, action)
+        await asyncio.sleep(0.01)
+
+    mock_get.assert_awaited_once_with(["TSLA"])
+    frames = [json.loads(call.args[0]) for call in websocket.send_text.await_args_list]
+    items = [item for frame in frames for item in frame.get("items", [frame])]
+    assert items[0]["type"] == "snapshot" and items[0]["data"] == assets
+    # The reply follows the snapshot (send_snapshot replaces what is queued before it)
+    assert items[1]["type"] in ("notification", "watchlist")
+
+    await manager.connection_manager.disconnect(websocket)
+
+
+@pytest.mark.asyncio
+async def test_refresh_sends_full_snapshot():
+    """Test that refresh (also sent on connect) delivers the full state as a snapshot"""
+    manager = WebSocketManager()
+    websocket = AsyncMock()
+    assets = [{"symbol": "AAPL", "current_price": 150.0}]
+
+    with (
+        patch.object(manager.connection_manager, "get_client_id", return_value="client_1"),
+        patch.object(manager, "get_assets_data", AsyncMock(return_value=assets)),
+        patch.object(manager.connection_manager, "send_message", AsyncMock()) as mock_send,
+    ):
+        await manager.handle_refresh(websocket)
+
+    message = mock_send.await_args.args[1]
+    assert message["type"] == "snapshot"
+    assert message["data"] == assets
+
+
+@pytest.mark.asyncio
+async def test_handle_message_rejects_invalid_json():
+    """Test that malformed client messages get an "Invalid JSON format" error"""
+    manager = WebSocketManager()
+    websocket = AsyncMock()
+
+    await manager.handle_message(websocket, "{not json")
+
+    sent = websocket.send_text.await_args.args[0]
+    assert '"Invalid JSON format"' in sent
+
+
+@pytest.mark.asyncio
+async def test_paused_client_skipped_until_resume():
+    """Test that pause stops streaming to a client and resume sends a snapshot"""
+    manager = WebSocketManager()
+    websocket = AsyncMock()
+    manager.connection_manager.active_connections[websocket] = {"id": "client_1"}
+
+    await manager.handle_message(websocket, '{"action": "pause"}')
+    assert manager.connection_manager.active_connections[websocket]["paused"] is True
+
+    with patch.object(manager, "handle_refresh", AsyncMock()) as mock_refresh:
+        await manager.handle_message(websocket, '{"action": "resume"}')
+        mock_refresh.assert_awaited_once_with(websocket)
+        # Resuming an already active client does not resend the snapshot
+        await manager.handle_message(websocket, '{"action": "resume"}')
+        mock_refresh.assert_awaited_once()
+
+    assert "paused" not in manager.connection_manager.active_connections[websocket]
+
+
+@pytest.mark.asyncio
+async def test_event_stream_snapshot_then_updates():
+    """Test that an SSE subscriber gets a snapshot, then the worker's shared update text"""
+    manager = WebSocketManager()
+    assets = [{"symbol": "AAPL", "current_price": 150.0}]
+
+    with patch.object(manager, "get_assets_data", AsyncMock(return_value=assets)):
+        stream = manager.event_stream(["AAPL"])
+        assert await stream.__anext__() == b"retry: 5000\n\n"
+        snapshot = await stream.__anext__()
+        assert snapshot.startswith(b'data: {"type":"snapshot"')
+        assert list(manager.event_streams.values()) == [("AAPL",)]
+
+        async def stop_after_tick(_delay):
+            manager.shutdown_event.set()
+
+        with patch("app.api.websocket.asyncio.sleep", side_effect=stop_after_tick):
+            await manager.data_stream_worker()
+        manager.shutdown_event.clear()
+
+        update = await stream.__anext__()
+        assert update.startswith(b'data: {"type":"update"') and update.endswith(b"\n\n")
+        await stream.aclose()
+
+    assert not manager.event_streams
+
+
+@pytest.mark.asyncio
+async def test_event_stream_resyncs_after_dropped_update():
+    """Test that an SSE subscriber whose queue overflowed gets a fresh snapshot"""
+    from app.managers.connection_manager import MAX_QUEUE_SIZE
+
+    manager = WebSocketManager()
+    assets = [{"symbol": "AAPL", "current_price": 150.0}]
+
+    with patch.object(manager, "get_assets_data", AsyncMock(return_value=assets)):
+        stream = manager.event_stream(["AAPL"])
+        await stream.__anext__()
+        await stream.__anext__()
+        (queue,) = manager.event_streams
+
+        for i in range(MAX_QUEUE_SIZE + 1):
+            manager._publish_event(queue, f'{{"n":{i}}}')
+
+        resync = await stream.__anext__()
+        assert resync.startswith(b'data: {"type":"snapshot"')
+        assert queue.empty()
+        await stream.aclose()
+
+
+def test_select_subprotocol():
+    """Test wire format negotiation from the offered subprotocols"""
+    from unittest.mock import Mock
+
+    from app.managers import connection_manager as cm
+
+    websocket = Mock()
+    websocket.scope = {"subprotocols": ["msgpack", "json"]}
+    with patch.object(cm, "MSGPACK_AVAILABLE", True):
+        assert cm.ConnectionManager._select_subprotocol(websocket) == "msgpack"
+    with patch.object(cm, "MSGPACK_AVAILABLE", False):
+        assert cm.ConnectionManager._select_subprotocol(websocket) == "json"
+
+    websocket.scope = {"subprotocols": ["json.deflate", "json"]}
+    assert cm.ConnectionManager._select_subprotocol(websocket) == "json.deflate"
+
+    websocket.scope = {"subprotocols": []}
+    assert cm.ConnectionManager._select_subprotocol(websocket) is None
+
+
 if __name__ == "__main__":
     print("Enhanced WebSocket tests completed!")
@@ -0,0 +1,88 @@
+"""Chart series downsampling (Largest-Triangle-Three-Buckets)
+
+A dashboard card is only a couple of hundred pixels wide, so sending more points than
+that only costs bytes and render time. LTTB keeps the first and last points and, for
+every bucket in between, the point forming the largest triangle with its neighbours,
+which preserves spikes and dips that plain stride sampling (``data[::step]``) drops.
+
+Points are assumed to be evenly spaced in time, so the point index is used as the x
+coordinate.
+
+Usage:
+    from app.utils.downsample import lttb_downsample
+
+    chart_data = lttb_downsample(chart_data, threshold=200, value_key="close")
+"""
+
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Roughly the plot width of a dashboard card in pixels
+DEFAULT_CHART_POINTS = 200
+
+
+def lttb_indices(values: Sequence[float], threshold: int) -> list[int]:
+    """
+    Select indices of the points kept by Largest-Triangle-Three-Buckets
+
+    Args:
+        values: Y values of the series
+        threshold: Maximum number of points to keep (at least 3 to downsample)
+
+    Returns:
+        Increasing list of selected indices
+    """
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        count = next_end - next_start
+        avg_x = (next_start + next_end - 1) / 2
+        avg_y = sum(values[next_start:next_end]) / count
+
+        start = int(i * every) + 1
+        end = next_start
+        ax = a
+        ay = values[a]
+        max_area = -1.0
+        best = start
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (values[j] - ay) - (ax - j) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                best = j
+        selected.append(best)
+        a = best
+
+    selected.append(n - 1)
+    return selected
+
+
+def lttb_downsample(
+    points: Sequence[T], threshold: int = DEFAULT_CHART_POINTS, value_key: Any = "price"
+) -> list[T]:
+    """
+    Downsample chart points with Largest-Triangle-Three-Buckets
+
+    Args:
+        points: Chart points (dicts or [timestamp, value] pairs)
+        threshold: Maximum number of points to keep
+        value_key: Key or index of the plotted value in each point
+
+    Returns:
+        Selected points in their original order (a copy of ``points`` if already small)
+    """
+    if len(points) <= threshold:
+        return list(points)
+    values = [float(point[value_key] or 0.0) for point in points]
+    return [points[i] for i in lttb_indices(values, threshold)]
@@ -0,0 +1,245 @@
+"""Fast JSON serialization helpers with optional C-accelerated backends
+
+This module picks the fastest available JSON encoder once at import time so that
+hot paths (WebSocket broadcasts, cache writes) serialize plain dict/TypedDict payloads
+in a single pass without an intermediate model layer.
+
+Backend preference:
+1. msgspec (optional) - fastest encoder, C-level
+2. orjson - C-accelerated, returns bytes
+3. stdlib json - always available fallback
+
+MessagePack (optional ``ormsgpack`` or ``msgpack`` package) and zlib-deflated JSON are used for WebSocket
+clients that negotiate the ``msgpack`` / ``json.deflate`` subprotocols; ``PreparedMessage``
+caches each encoding so a broadcast payload is encoded (and compressed) at most once per
+wire format instead of once per client.
+
+Usage:
+    from app.utils.serialization import dumps, dumps_str, loads
+
+    payload = dumps({"type": "update", "data": assets})  # bytes
+    text = dumps_str(message)  # str for WebSocket text frames
+"""
+
+import json
+import logging
+import zlib
+from datetime import date, time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# NumPy scalars (pandas-derived values) are encoded as numbers, not strings
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _default(obj: Any) -> Any:
+    """
+    Convert types the encoders do not handle natively
+
+    Args:
+        obj: Object the encoder could not serialize
+
+    Returns:
+        JSON-compatible replacement
+
+    Raises:
+        TypeError: If the type is not supported
+    """
+    if np is not None:
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+try:
+    import msgspec  # type: ignore
+
+    _msgspec_encoder = msgspec.json.Encoder(enc_hook=_default)
+    _msgspec_decoder = msgspec.json.Decoder()
+    BACKEND = "msgspec"
+except ImportError:
+    msgspec = None
+    _msgspec_encoder = None
+    _msgspec_decoder = None
+    try:
+        import orjson  # type: ignore
+
+        BACKEND = "orjson"
+    except ImportError:
+        orjson = None
+        BACKEND = "json"
+
+# Exceptions loads() raises for malformed input, whatever the backend
+# (stdlib and orjson decode errors are ValueError subclasses)
+DecodeError: type[Exception] | tuple[type[Exception], ...] = (
+    (ValueError, msgspec.DecodeError) if msgspec is not None else ValueError
+)
+
+# Fast compression level for broadcast frames compressed once per tick
+DEFLATE_LEVEL = 1
+
+# MessagePack backend: ormsgpack (Rust, fastest) -> msgpack -> unavailable
+try:
+    import ormsgpack  # type: ignore
+except ImportError:
+    ormsgpack = None
+
+try:
+    import msgpack  # type: ignore
+except ImportError:
+    msgpack = None
+
+MSGPACK_AVAILABLE = ormsgpack is not None or msgpack is not None
+
+# Encoded {"type": "batch", "items": <array header follows>} prefix of batch frames
+_PACKED_BATCH_PREFIX = b"\x82\xa4type\xa5batch\xa5items"
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize object to UTF-8 JSON bytes
+
+    Args:
+        obj: JSON-compatible object (NumPy values and datetimes are converted)
+
+    Returns:
+        Encoded JSON bytes
+
+    Raises:
+        TypeError: If the object contains an unsupported type
+    """
+    if _msgspec_encoder is not None:
+        return _msgspec_encoder.encode(obj)
+    if BACKEND == "orjson":
+        return orjson.dumps(
+            obj, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_str(obj: Any) -> str:
+    """
+    Serialize object to a JSON string (for WebSocket text frames)
+
+    Args:
+        obj: JSON-compatible object
+
+    Returns:
+        Encoded JSON string
+    """
+    return dumps(obj).decode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Deserialize JSON bytes or string
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded Python object
+    """
+    if _msgspec_decoder is not None:
+        return _msgspec_decoder.decode(data)
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def packb(obj: Any) -> bytes:
+    """
+    Serialize object to MessagePack bytes (requires the optional msgpack package)
+
+    Args:
+        obj: Object to serialize (NumPy values and datetimes are converted)
+
+    Returns:
+        Encoded MessagePack bytes
+
+    Raises:
+        TypeError: If the object contains an unsupported type
+    """
+    if ormsgpack is not None:
+        return ormsgpack.packb(
+            obj,
+            default=_default,
+            option=ormsgpack.OPT_NON_STR_KEYS | ormsgpack.OPT_SERIALIZE_NUMPY,
+        )
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.packb(obj, default=_default, use_bin_type=True)
+
+
+def batch_frame_text(items: list[str]) -> str:
+    """Combine already serialized JSON messages into one batch frame"""
+    return '{"type":"batch","items":[' + ",".join(items) + "]}"
+
+
+def deflate(data: str | bytes) -> bytes:
+    """Compress a serialized frame with zlib (fast level, decodable by DecompressionStream)"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return zlib.compress(data, DEFLATE_LEVEL)
+
+
+def batch_frame_packed(items: list[bytes]) -> bytes:
+    """Combine already packed MessagePack messages into one batch frame"""
+    count = len(items)
+    if count < 16:
+        array_header = bytes((0x90 | count,))
+    elif count < 0x10000:
+        array_header = b"\xdc" + count.to_bytes(2, "big")
+    else:
+        array_header = b"\xdd" + count.to_bytes(4, "big")
+    return _PACKED_BATCH_PREFIX + array_header + b"".join(items)
+
+
+class PreparedMessage:
+    """Outgoing message with lazily cached JSON text and MessagePack encodings"""
+
+    __slots__ = ("_obj", "_text", "_packed", "_deflated")
+
+    def __init__(self, obj: Any = None, text: str | None = None):
+        """
+        Args:
+            obj: Message object
+            text: Already serialized JSON text (used when obj is not given)
+        """
+        self._obj = obj
+        self._text = text
+        self._packed: bytes | None = None
+        self._deflated: bytes | None = None
+
+    @property
+    def text(self) -> str:
+        """JSON text encoding"""
+        if self._text is None:
+            self._text = dumps_str(self._obj)
+        return self._text
+
+    @property
+    def packed(self) -> bytes:
+        """MessagePack encoding"""
+        if self._packed is None:
+            obj = self._obj if self._obj is not None else loads(self._text)
+            self._packed = packb(obj)
+        return self._packed
+
+    @property
+    def deflated(self) -> bytes:
+        """zlib-compressed JSON text encoding"""
+        if self._deflated is None:
+            self._deflated = deflate(self.text)
+        return self._deflated
+
+
+logger.debug(f"JSON serialization backend: {BACKEND}")
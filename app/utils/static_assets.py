@@ -0,0 +1,259 @@
+"""Precompressed in-memory static assets for the dashboard
+
+Dashboard files are read once at import time, optionally transformed (minified), hashed
+for an ETag and a content-versioned file name, and compressed with gzip (and brotli when
+the optional ``brotli`` package is installed). Each request then only negotiates
+``Accept-Encoding`` and returns an already built response object.
+
+Usage:
+    from app.utils.static_assets import StaticAsset
+
+    asset = StaticAsset(path, "text/css; charset=utf-8")
+    return asset.response(request)
+"""
+
+import gzip
+import hashlib
+import logging
+import re
+from collections.abc import Callable
+from pathlib import Path
+
+from fastapi import Request, Response
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Optional brotli support; gzip is always available
+try:
+    import brotli  # type: ignore
+except ImportError:
+    brotli = None
+
+# For content-versioned URLs: a new build changes the URL, so browsers never revalidate
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Optional rcssmin minifier; a conservative regex minifier is used otherwise
+try:
+    import rcssmin  # type: ignore
+except ImportError:
+    rcssmin = None
+
+# Optional rjsmin minifier; without it scripts are served as written (regex JS
+# minification is not safe around strings, template literals and regex literals)
+try:
+    import rjsmin  # type: ignore
+except ImportError:
+    rjsmin = None
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+_CSS_PUNCTUATION_RE = re.compile(r"\s*([{};,>])\s*")
+# Only whitespace after a colon: "a :hover" is a different selector than "a:hover"
+_CSS_COLON_RE = re.compile(r":\s+")
+
+_HTML_COMMENT_RE = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+# Indentation and blank lines only; whitespace between tags can be significant for
+# inline elements, so newlines are kept as single separators
+_HTML_INDENT_RE = re.compile(r"\n\s+")
+
+
+def minify_css(css: str) -> str:
+    """
+    Minify a stylesheet (comments and redundant whitespace removed)
+
+    Args:
+        css: Stylesheet source
+
+    Returns:
+        Minified stylesheet
+    """
+    if rcssmin is not None:
+        return rcssmin.cssmin(css)
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_WHITESPACE_RE.sub(" ", css)
+    css = _CSS_PUNCTUATION_RE.sub(r"\1", css)
+    css = _CSS_COLON_RE.sub(":", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(js: str) -> str:
+    """
+    Minify a script when rjsmin is installed
+
+    Args:
+        js: Script source
+
+    Returns:
+        Minified script (unchanged source without rjsmin)
+    """
+    if rjsmin is not None:
+        return rjsmin.jsmin(js)
+    return js
+
+
+def minify_html(html: str) -> str:
+    """
+    Minify a page (comments, indentation and blank lines removed)
+
+    Not suitable for pages with <pre> or <textarea> content, whose whitespace matters.
+
+    Args:
+        html: Page source
+
+    Returns:
+        Minified page
+    """
+    html = _HTML_COMMENT_RE.sub("", html)
+    return _HTML_INDENT_RE.sub("\n", html).strip()
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    """Parse Accept-Encoding header into a set of codings with non-zero quality"""
+    encodings = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if q > 0:
+            encodings.add(coding)
+    return encodings
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header (list of tags, "*", weak W/ tags) against an ETag"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class _PreparedResponse(Response):
+    """Response built once and sent for many requests
+
+    Middleware may edit the header list of a sent response (e.g. rate limit headers), so
+    every send gets its own copy instead of the shared raw_headers.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": list(self.raw_headers),
+            }
+        )
+        await send({"type": "http.response.body", "body": self.body})
+
+
+class StaticAsset:
+    """Static file kept in memory with precomputed ETag and compressed variants"""
+
+    def __init__(
+        self,
+        path: Path,
+        media_type: str,
+        cache_control: str = "public, max-age=300",
+        transform: Callable[[str], str] | None = None,
+    ):
+        """
+        Load and precompress a static file
+
+        Args:
+            path: Path to the file
+            media_type: Content-Type header value
+            cache_control: Cache-Control header value
+            transform: Optional text transform applied once at load time (e.g. minify_css)
+        """
+        self.path = Path(path)
+        self.media_type = media_type
+        self.cache_control = cache_control
+        self.content = self.path.read_bytes()
+        if transform is not None:
+            self.content = transform(self.content.decode("utf-8")).encode("utf-8")
+        self.digest = hashlib.blake2b(self.content, digest_size=8).hexdigest()
+
+        # encoding -> (body, etag); identity is always present
+        self.variants: dict[str, tuple[bytes, str]] = {
+            "identity": (self.content, f'"{self.digest}"'),
+            "gzip": (gzip.compress(self.content, compresslevel=9, mtime=0), f'"{self.digest}-gz"'),
+        }
+        if brotli is not None:
+            self.variants["br"] = (brotli.compress(self.content, quality=11), f'"{self.digest}-br"')
+        # (encoding, cache_control, not_modified) -> response reused across requests
+        self._responses: dict[tuple[str, str, bool], Response] = {}
+
+        logger.debug(
+            f"Loaded static asset {self.path.name}: "
+            + ", ".join(f"{enc}={len(body)}B" for enc, (body, _) in self.variants.items())
+        )
+
+    @property
+    def versioned_name(self) -> str:
+        """File name with the content digest, e.g. dashboard.1a2b3c4d5e6f7a8b.css"""
+        return f"{self.path.stem}.{self.digest}{self.path.suffix}"
+
+    def select_encoding(self, accept_encoding: str) -> str:
+        """
+        Pick the best available encoding for the client
+
+        Args:
+            accept_encoding: Value of the Accept-Encoding request header
+
+        Returns:
+            "br", "gzip" or "identity"
+        """
+        accepted = _accepted_encodings(accept_encoding)
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and encoding in accepted:
+                return encoding
+        return "identity"
+
+    def response(self, request: Request, cache_control: str | None = None) -> Response:
+        """
+        Build a response for the request (304 if the client copy is current)
+
+        Args:
+            request: Incoming request
+            cache_control: Cache-Control override (e.g. IMMUTABLE_CACHE_CONTROL)
+
+        Returns:
+            Response with the negotiated representation
+        """
+        encoding = self.select_encoding(request.headers.get("accept-encoding", ""))
+        cache_control = cache_control or self.cache_control
+        etag = self.variants[encoding][1]
+        not_modified = _etag_matches(request.headers.get("if-none-match", ""), etag)
+
+        key = (encoding, cache_control, not_modified)
+        response = self._responses.get(key)
+        if response is None:
+            response = self._responses[key] = self._build_response(
+                encoding, cache_control, not_modified
+            )
+        return response
+
+    def _build_response(self, encoding: str, cache_control: str, not_modified: bool) -> Response:
+        """Build the response for one encoding / Cache-Control / 304 combination"""
+        body, etag = self.variants[encoding]
+        headers = {
+            "ETag": etag,
+            "Cache-Control": cache_control,
+            "Vary": "Accept-Encoding",
+        }
+
+        if not_modified:
+            return _PreparedResponse(status_code=304, headers=headers)
+
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return _PreparedResponse(content=body, media_type=self.media_type, headers=headers)
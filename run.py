@@ -1,10 +1,27 @@
 """Файл запуска для приложения FastAPI Finance Monitor"""
 
 import argparse
+import importlib.util
 import os
 
 import uvicorn
 
+# uvloop (libuv, C) is much faster than the default selector loop; not available on Windows
+LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+# httptools (llhttp, C) parses HTTP/1.1 much faster than the pure-Python h11
+HTTP = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+# Listen backlog for connection bursts (e.g. all dashboards reconnecting after a deploy)
+BACKLOG = int(os.getenv("BACKLOG", "2048"))
+
+# Keep idle HTTP connections longer than typical load balancer idle timeouts (60s), so the
+# proxy never reuses a connection the server is closing
+TIMEOUT_KEEP_ALIVE = int(os.getenv("TIMEOUT_KEEP_ALIVE", "75"))
+
+# permessage-deflate for WebSocket connections (off: the app compresses broadcasts itself)
+WS_PER_MESSAGE_DEFLATE = os.getenv("WS_PER_MESSAGE_DEFLATE", "false").lower() == "true"
+
 # Версия приложения (можно вынести в отдельный файл, например, __version__.py)
 __version__ = "0.1.0"
 
@@ -18,6 +35,16 @@ def _run_uvicorn(host: str, port: int, reload: bool, workers: int, log_level: st
         reload=reload,
         workers=workers,
         log_level=log_level,
+        loop=LOOP,
+        http=HTTP,
+        ws="websockets",
+        backlog=BACKLOG,
+        timeout_keep_alive=TIMEOUT_KEEP_ALIVE,
+        # Broadcast frames are compressed once by the app (json.deflate subprotocol);
+        # per-connection deflate would recompress the same bytes for every client.
+        # WS_PER_MESSAGE_DEFLATE=true enables it for deployments whose clients only speak
+        # plain JSON and where bandwidth matters more than server CPU.
+        ws_per_message_deflate=WS_PER_MESSAGE_DEFLATE,
     )
 
 